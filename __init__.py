@@ -4,13 +4,34 @@ from __future__ import annotations
 import logging
 from typing import Final
 
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    CONF_WRITE_BURST,
+    CONF_WRITE_RATE,
+    CONF_PREVIOUS_SHARDS,
+    CONF_SHARDS,
+    DATA_SCHEDULER,
+    DEFAULT_WRITE_BURST,
+    DEFAULT_WRITE_RATE,
+    HYDRATION_TIMEOUT,
+    SERVICE_BRIDGE_SHARDS,
+)
+from .models import HomeKitDeviceContext
+from .scheduler import UpdateScheduler
+from .sharding import BRIDGE_SHARDS_SCHEMA, async_bridge_shards
 
 _LOGGER: Final = logging.getLogger(__name__)
 
@@ -18,41 +39,88 @@ PLATFORMS: Final = [
     Platform.SWITCH,
     Platform.SENSOR,
     Platform.NUMBER,
-    Platform.SELECT,
     Platform.BINARY_SENSOR,
     Platform.LIGHT,
+    Platform.COVER,
+    Platform.FAN,
+    Platform.HUMIDIFIER,
+    Platform.ALARM_CONTROL_PANEL,
 ]
 
+CONFIG_SCHEMA: Final = vol.Schema(
+    {
+        DOMAIN: vol.Schema(
+            {
+                vol.Optional(CONF_WRITE_RATE, default=DEFAULT_WRITE_RATE): vol.All(
+                    vol.Coerce(float), vol.Range(min=0.1)
+                ),
+                vol.Optional(CONF_WRITE_BURST, default=DEFAULT_WRITE_BURST): vol.All(
+                    vol.Coerce(int), vol.Range(min=1)
+                ),
+            }
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the HomeKit Device Aggregator integration."""
     hass.data.setdefault(DOMAIN, {})
+    conf = config.get(DOMAIN, {})
+    hass.data[DATA_SCHEDULER] = UpdateScheduler(
+        hass,
+        write_rate=conf.get(CONF_WRITE_RATE, DEFAULT_WRITE_RATE),
+        write_burst=conf.get(CONF_WRITE_BURST, DEFAULT_WRITE_BURST),
+    )
+
+    async def _async_bridge_shards(call: ServiceCall) -> ServiceResponse:
+        """Return the bridge include filters for a number of shards."""
+        return async_bridge_shards(
+            hass, call.data[CONF_SHARDS], call.data.get(CONF_PREVIOUS_SHARDS)
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BRIDGE_SHARDS,
+        _async_bridge_shards,
+        schema=BRIDGE_SHARDS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
     return True
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up HomeKit Device Aggregator from a config entry."""
     hass.data.setdefault(DOMAIN, {})
-    device_type = entry.data.get("device_type", "Unknown")
-    hass.data[DOMAIN][entry.entry_id] = {
-        "config": entry.data,
-        "device_type": device_type,
-        "entities": set(),
-    }
+    context = HomeKitDeviceContext.from_entry(hass, entry, hass.data[DATA_SCHEDULER])
+    hass.data[DOMAIN][entry.entry_id] = context
 
     # Register device
     device_registry = dr.async_get(hass)
     device_registry.async_get_or_create(
         config_entry_id=entry.entry_id,
-        identifiers={(DOMAIN, f"{DOMAIN}_{entry.entry_id}")},
+        identifiers={(DOMAIN, context.identifier)},
         name=entry.title,
         manufacturer="HomeKit Device Aggregator",
-        model=device_type.title(),
-        suggested_area="Kitchen" if device_type == "kettle" else None,
+        model=context.device_type.title(),
+        suggested_area="Kitchen" if context.device_type == "kettle" else None,
     )
 
+    entry.async_on_unload(context.health.async_start())
+
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_create_background_task(
+        hass,
+        context.hydrator.async_hydrate(HYDRATION_TIMEOUT),
+        f"{DOMAIN} hydrate {entry.title}",
+    )
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
     return True
 
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload a config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
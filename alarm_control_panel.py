@@ -0,0 +1,211 @@
+"""Platform for alarm control panel integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.alarm_control_panel import (
+    AlarmControlPanelEntity,
+    AlarmControlPanelEntityFeature,
+    AlarmControlPanelState,
+    CodeFormat,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import STATE_ON
+from homeassistant.core import HomeAssistant, State
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import (
+    DOMAIN,
+    CONF_NAME,
+    CONF_ALARM_STATE,
+    CONF_SENSORS,
+    CONF_SIREN,
+)
+from .entity import HomeKitDeviceCompositeEntity
+from .models import HomeKitDeviceContext
+
+# Source alarm states, by their state string
+ALARM_STATES = {state.value: state for state in AlarmControlPanelState}
+
+# Armed states in which a tripped sensor reports the alarm as triggered. In home
+# and night mode people move about inside, and in custom bypass mode only the
+# source panel knows which zones are bypassed, so those are left to the panel.
+SENSOR_TRIGGER_STATES = frozenset(
+    {
+        AlarmControlPanelState.ARMED_AWAY,
+        AlarmControlPanelState.ARMED_VACATION,
+    }
+)
+
+# HomeKit SecuritySystemCurrentState: 0 stay, 1 away, 2 night, 3 disarmed, 4 triggered
+HOMEKIT_CURRENT_STATE = {
+    AlarmControlPanelState.ARMED_HOME: 0,
+    AlarmControlPanelState.ARMED_CUSTOM_BYPASS: 0,
+    AlarmControlPanelState.ARMED_AWAY: 1,
+    AlarmControlPanelState.ARMED_VACATION: 1,
+    AlarmControlPanelState.ARMED_NIGHT: 2,
+    AlarmControlPanelState.DISARMED: 3,
+    AlarmControlPanelState.TRIGGERED: 4,
+}
+
+# HomeKit SecuritySystemTargetState: 0 stay, 1 away, 2 night, 3 disarm
+HOMEKIT_TARGET_STATE = {
+    AlarmControlPanelState.ARMED_HOME: 0,
+    AlarmControlPanelState.ARMED_CUSTOM_BYPASS: 0,
+    AlarmControlPanelState.ARMED_AWAY: 1,
+    AlarmControlPanelState.ARMED_VACATION: 1,
+    AlarmControlPanelState.ARMED_NIGHT: 2,
+    AlarmControlPanelState.DISARMED: 3,
+}
+
+CODE_FORMATS = {code_format.value: code_format for code_format in CodeFormat}
+
+class HomeKitDeviceAlarmControlPanel(HomeKitDeviceCompositeEntity, AlarmControlPanelEntity):
+    """Representation of a HomeKit Device security system.
+
+    The alarm panel source is combined with the siren and the security
+    sensors: a sounding siren, or a tripped sensor while armed away or on
+    vacation, reports the system as triggered. States are translated through static tables
+    and commands are passed straight to the source panel.
+    """
+
+    __slots__ = ("_alarm", "_siren_on", "_tripped", "_current", "_target")
+
+    def __init__(
+        self,
+        context: HomeKitDeviceContext,
+        name: str,
+        alarm: str,
+        siren: str | None = None,
+        sensors: list[str] | None = None,
+    ) -> None:
+        """Initialize the alarm control panel."""
+        super().__init__(context, name, alarm)
+        self._alarm: AlarmControlPanelState | None = None
+        self._siren_on = False
+        self._tripped: set[str] = set()
+        self._current: int | None = None
+        self._target: int | None = None
+
+        self._add_source(alarm, self._apply_alarm)
+        if siren:
+            self._add_source(siren, self._apply_siren)
+        for sensor in sensors or ():
+            self._add_source(sensor, self._apply_sensor)
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return the HomeKit states and the tripped sensors."""
+        return {
+            "current_state": self._current,
+            "target_state": self._target,
+            "siren": self._siren_on,
+            "tripped_sensors": sorted(self._tripped),
+        }
+
+    def _apply_alarm(self, state: State, value: Any) -> None:
+        self._alarm = ALARM_STATES.get(value)
+        attributes = state.attributes
+        self._attr_supported_features = AlarmControlPanelEntityFeature(
+            attributes.get("supported_features", 0)
+        )
+        self._attr_code_format = CODE_FORMATS.get(attributes.get("code_format"))
+        self._attr_code_arm_required = attributes.get("code_arm_required", True)
+        # Transitional states leave the HomeKit target where it was
+        self._target = HOMEKIT_TARGET_STATE.get(self._alarm, self._target)
+        self._update_state()
+
+    def _apply_siren(self, state: State, value: Any) -> None:
+        self._siren_on = value == STATE_ON
+        self._update_state()
+
+    def _apply_sensor(self, state: State, value: Any) -> None:
+        if value == STATE_ON:
+            self._tripped.add(state.entity_id)
+        else:
+            self._tripped.discard(state.entity_id)
+        self._update_state()
+
+    def _update_state(self) -> None:
+        """Derive the reported state from the panel, siren and sensors."""
+        if self._siren_on or (self._tripped and self._alarm in SENSOR_TRIGGER_STATES):
+            alarm = AlarmControlPanelState.TRIGGERED
+        else:
+            alarm = self._alarm
+        self._attr_alarm_state = alarm
+        self._current = HOMEKIT_CURRENT_STATE.get(alarm, self._current)
+
+    def _build_snapshot(self) -> tuple:
+        """Return the values the panel publishes."""
+        return (
+            self._attr_alarm_state,
+            self._current,
+            self._target,
+            self._siren_on,
+            len(self._tripped),
+            self._attr_supported_features,
+            self._attr_code_format,
+            self._attr_code_arm_required,
+        )
+
+    async def _async_call(self, service: str, code: str | None) -> None:
+        """Pass a command to the source panel."""
+        data = {"entity_id": self._source_entity}
+        if code:
+            data["code"] = code
+        await self.hass.services.async_call("alarm_control_panel", service, data)
+
+    async def async_alarm_disarm(self, code: str | None = None) -> None:
+        """Send disarm command."""
+        await self._async_call("alarm_disarm", code)
+
+    async def async_alarm_arm_home(self, code: str | None = None) -> None:
+        """Send arm home command."""
+        await self._async_call("alarm_arm_home", code)
+
+    async def async_alarm_arm_away(self, code: str | None = None) -> None:
+        """Send arm away command."""
+        await self._async_call("alarm_arm_away", code)
+
+    async def async_alarm_arm_night(self, code: str | None = None) -> None:
+        """Send arm night command."""
+        await self._async_call("alarm_arm_night", code)
+
+    async def async_alarm_arm_vacation(self, code: str | None = None) -> None:
+        """Send arm vacation command."""
+        await self._async_call("alarm_arm_vacation", code)
+
+    async def async_alarm_arm_custom_bypass(self, code: str | None = None) -> None:
+        """Send arm custom bypass command."""
+        await self._async_call("alarm_arm_custom_bypass", code)
+
+    async def async_alarm_trigger(self, code: str | None = None) -> None:
+        """Send trigger command."""
+        await self._async_call("alarm_trigger", code)
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the HomeKit Device alarm control panels."""
+    context: HomeKitDeviceContext = hass.data[DOMAIN][config_entry.entry_id]
+    device_type = context.device_type
+    base_name = config_entry.data.get(CONF_NAME, "Smart Device")
+    entities = []
+
+    # Device-specific alarm control panels
+    if device_type == "security_system":
+        if alarm := config_entry.data.get(CONF_ALARM_STATE):
+            entities.append(
+                HomeKitDeviceAlarmControlPanel(
+                    context,
+                    f"{base_name} Alarm",
+                    alarm,
+                    config_entry.data.get(CONF_SIREN),
+                    config_entry.data.get(CONF_SENSORS),
+                )
+            )
+
+    if entities:
+        async_add_entities(entities)
@@ -0,0 +1,197 @@
+"""Time the discovery scan over large entity and device registries.
+
+Run with ``python benchmarks/discovery_scan.py [--entities N] [--repeat N]``
+in an environment with Home Assistant installed. The script fills
+synthetic entity, device and area registries with devices of every kind
+the integration aggregates, plus loose entities with no device, and times
+a full scan for candidates. It exits non-zero if the median scan takes
+longer than the budget.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import itertools
+from pathlib import Path
+import random
+import statistics
+import sys
+import time
+from types import SimpleNamespace
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_ENTITIES = 6000
+DEFAULT_REPEAT = 20
+DEFAULT_BUDGET_MS = 100.0
+DEFAULT_SEED = 0
+
+AREAS = (
+    "Kitchen", "Living Room", "Bedroom", "Office", "Garage", "Hallway",
+    "Bathroom", "Nursery", "Attic", "Basement", "Porch", "Study",
+)
+
+# Entities of each synthetic device: domain, name suffix and device class
+DEVICE_KINDS = {
+    "Kettle": (
+        ("switch", "Power", "outlet"),
+        ("sensor", "Temperature", "temperature"),
+        ("number", "Target Temperature", None),
+        ("sensor", "Status", None),
+        ("sensor", "Countdown", "duration"),
+    ),
+    "Fan": (
+        ("switch", "Power", "switch"),
+        ("number", "Speed", None),
+        ("switch", "Oscillation", None),
+        ("select", "Direction", None),
+    ),
+    "Humidifier": (
+        ("switch", "Power", "switch"),
+        ("sensor", "Humidity", "humidity"),
+        ("number", "Target Humidity", None),
+        ("sensor", "Water Level", None),
+    ),
+    "Air Purifier": (
+        ("switch", "Power", "switch"),
+        ("sensor", "Air Quality", "aqi"),
+        ("sensor", "Filter Life", None),
+        ("sensor", "PM2.5", "pm25"),
+    ),
+    "Garage Door": (
+        ("cover", "Door", "garage"),
+        ("binary_sensor", "Obstruction", "problem"),
+        ("switch", "Light", None),
+    ),
+    "Plug": (
+        ("switch", "Outlet", "outlet"),
+        ("sensor", "Power", "power"),
+        ("sensor", "Energy", "energy"),
+    ),
+}
+LOOSE_ENTITIES = (
+    ("light", "Lamp", None),
+    ("binary_sensor", "Window", "window"),
+    ("binary_sensor", "Motion", "motion"),
+    ("sensor", "Temperature", "temperature"),
+    ("input_boolean", "Guest Mode", None),
+)
+
+def _load_integration():
+    """Import the integration as the homekit_device package."""
+    spec = importlib.util.spec_from_file_location(
+        "homekit_device",
+        ROOT / "__init__.py",
+        submodule_search_locations=[str(ROOT)],
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["homekit_device"] = module
+    spec.loader.exec_module(module)
+    return module
+
+def _registry_entry(
+    entity_id: str,
+    name: str,
+    device_class: str | None,
+    device_id: str | None = None,
+    area_id: str | None = None,
+):
+    """Return an entity registry entry with the fields discovery reads."""
+    return SimpleNamespace(
+        entity_id=entity_id,
+        domain=entity_id.partition(".")[0],
+        platform="benchmark",
+        disabled_by=None,
+        name=None,
+        original_name=name,
+        device_class=None,
+        original_device_class=device_class,
+        device_id=device_id,
+        area_id=area_id,
+    )
+
+def _build_registries(count: int) -> tuple:
+    """Return entity, device and area registries holding count entities."""
+    areas = {
+        area.lower().replace(" ", "_"): SimpleNamespace(name=area) for area in AREAS
+    }
+    devices: dict[str, SimpleNamespace] = {}
+    entities: dict[str, SimpleNamespace] = {}
+    kinds = itertools.cycle(DEVICE_KINDS.items())
+    number = 0
+    # Four fifths of the entities belong to devices, the rest are loose
+    while len(entities) < count * 4 // 5:
+        kind, members = next(kinds)
+        number += 1
+        area_id = random.choice(list(areas))
+        device_id = f"device_{number}"
+        device_name = f"{areas[area_id].name} {kind} {number}"
+        devices[device_id] = SimpleNamespace(
+            area_id=area_id, name=device_name, name_by_user=None
+        )
+        for domain, suffix, device_class in members:
+            name = f"{device_name} {suffix}"
+            entity_id = f"{domain}.{name.lower().replace(' ', '_').replace('.', '')}"
+            entities[entity_id] = _registry_entry(
+                entity_id, name, device_class, device_id=device_id
+            )
+    while len(entities) < count:
+        domain, suffix, device_class = random.choice(LOOSE_ENTITIES)
+        area_id = random.choice(list(areas))
+        name = f"{areas[area_id].name} {suffix} {len(entities)}"
+        entity_id = f"{domain}.{name.lower().replace(' ', '_')}"
+        entities[entity_id] = _registry_entry(
+            entity_id, name, device_class, area_id=area_id
+        )
+
+    entity_registry = SimpleNamespace(entities=entities)
+    device_registry = SimpleNamespace(devices=devices)
+    area_registry = SimpleNamespace(async_get_area=areas.get)
+    return entity_registry, device_registry, area_registry
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entities", type=int, default=DEFAULT_ENTITIES)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument(
+        "--budget", type=float, default=DEFAULT_BUDGET_MS, help="allowed scan time in ms"
+    )
+    args = parser.parse_args()
+    random.seed(args.seed)
+
+    _load_integration()
+    from homekit_device import discovery
+    from homekit_device.config_flow import get_device_schema
+    from homekit_device.const import DEVICE_TYPES
+
+    entity_registry, device_registry, area_registry = _build_registries(args.entities)
+    # The scan only reads the registries, so plain objects can stand in for them
+    discovery.er = SimpleNamespace(async_get=lambda hass: entity_registry)
+    discovery.dr = SimpleNamespace(async_get=lambda hass: device_registry)
+    discovery.ar = SimpleNamespace(async_get=lambda hass: area_registry)
+    hass = SimpleNamespace(config_entries=SimpleNamespace(async_entries=lambda domain: []))
+    schemas = {device_type: get_device_schema(device_type) for device_type in DEVICE_TYPES}
+
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        candidates = discovery.async_discover_candidates(hass, schemas)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    median = statistics.median(timings)
+    print(
+        f"{len(entity_registry.entities)} entities on {len(device_registry.devices)} devices:"
+        f" {len(candidates)} candidates"
+    )
+    print(f"scan: {min(timings):.1f} ms best, {median:.1f} ms median")
+    if not candidates:
+        print("no candidates were found")
+        return 1
+    if median > args.budget:
+        print(f"the median scan is over the budget of {args.budget} ms")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""Check that transform expressions cannot run away with the CPU.
+
+Run with ``python benchmarks/expression_limits.py`` in an environment
+with Home Assistant installed. Expressions that would build huge numbers
+must be rejected when they are compiled, and the costliest expressions
+that are accepted must still evaluate within the budget. The script
+exits non-zero if either check fails.
+"""
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+import sys
+import timeit
+
+ROOT = Path(__file__).resolve().parent.parent
+BUDGET_US = 50.0
+
+REJECTED = (
+    "x ** 9",
+    "x ** x",
+    "10 ** x",
+    "9 ** 9 ** 9",
+    "(9 ** 8) ** 8",
+    "((9 ** 8) ** 8) ** 8",
+    "(-(9 ** 8)) ** 8",
+    "round(9 ** 8) ** 8",
+    "(x + 9 ** 8) ** 8",
+)
+ACCEPTED = (
+    "x ** 8",
+    "9 ** 8 * 9 ** 8 * x",
+    "(x * 99999999) ** 8",
+    "round(x / 10, 1) ** -8",
+)
+
+def _load_integration():
+    """Import the integration as the homekit_device package."""
+    spec = importlib.util.spec_from_file_location(
+        "homekit_device",
+        ROOT / "__init__.py",
+        submodule_search_locations=[str(ROOT)],
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["homekit_device"] = module
+    spec.loader.exec_module(module)
+    return module
+
+def main() -> int:
+    """Run the checks."""
+    _load_integration()
+    from homekit_device.transforms import InvalidTransform, compile_expression
+
+    failed = False
+    for expression in REJECTED:
+        try:
+            compile_expression(expression)
+        except InvalidTransform:
+            continue
+        print(f"accepted: {expression}")
+        failed = True
+
+    number = 10_000
+    for expression in ACCEPTED:
+        function = compile_expression(expression)
+
+        def evaluate(function=function) -> None:
+            try:
+                function(123.4)
+            except ArithmeticError:
+                pass
+
+        per_call = timeit.timeit(evaluate, number=number) / number * 1e6
+        print(f"{expression}: {per_call:.2f} us")
+        if per_call > BUDGET_US:
+            print(f"  over the budget of {BUDGET_US} us")
+            failed = True
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
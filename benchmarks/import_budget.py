@@ -0,0 +1,102 @@
+"""Check the import-time cost of the integration against a budget.
+
+Run with ``python benchmarks/import_budget.py [--budget MICROSECONDS]`` in
+an environment with Home Assistant installed. The script imports what
+Home Assistant itself has loaded before any integration, then imports the
+integration under ``python -X importtime`` and sums the cost of every
+module that import pulls in. It fails if that cost exceeds the budget, or
+if loading the integration imports an entity platform component, which
+should only happen when its platform is forwarded.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+from pathlib import Path
+import re
+import subprocess
+import sys
+import tempfile
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = "homekit_device"
+MARKER = "_import_budget_marker"
+DEFAULT_BUDGET_US = 30_000
+
+# Modules Home Assistant has already imported when it sets up an integration
+PRELUDE = (
+    "voluptuous",
+    "homeassistant.const",
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.config_validation",
+    "homeassistant.helpers.device_registry",
+    "homeassistant.helpers.entity",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.event",
+    "homeassistant.helpers.typing",
+    "homeassistant.util.dt",
+)
+
+_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+def _measure() -> list[tuple[str, int, int]]:
+    """Return (module, self us, cumulative us) for modules the integration imports."""
+    with tempfile.TemporaryDirectory() as tmp:
+        os.symlink(ROOT, Path(tmp) / PACKAGE)
+        (Path(tmp) / f"{MARKER}.py").write_text("")
+        code = "; ".join(
+            [*(f"import {module}" for module in PRELUDE), f"import {MARKER}", f"import {PACKAGE}"]
+        )
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            cwd=tmp,
+            env={**os.environ, "PYTHONPATH": tmp},
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    if result.returncode:
+        sys.stderr.write(result.stderr)
+        raise SystemExit(f"Importing {PACKAGE} failed")
+
+    modules = []
+    seen_marker = False
+    for line in result.stderr.splitlines():
+        if not (match := _LINE.match(line)):
+            continue
+        name = match.group(4)
+        if name == MARKER:
+            seen_marker = True
+            continue
+        if seen_marker:
+            modules.append((name, int(match.group(1)), int(match.group(2))))
+    return modules
+
+def main() -> int:
+    """Run the check."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget", type=int, default=DEFAULT_BUDGET_US)
+    args = parser.parse_args()
+
+    modules = _measure()
+    total = next((cumulative for name, _, cumulative in modules if name == PACKAGE), 0)
+    platforms = sorted(
+        name for name, _, _ in modules if name.startswith("homeassistant.components.")
+    )
+
+    print(f"{PACKAGE} import cost: {total} us (budget {args.budget} us)")
+    for name, self_us, _ in sorted(modules, key=lambda module: module[1], reverse=True)[:10]:
+        print(f"  {self_us:>8} us  {name}")
+
+    failed = False
+    if platforms:
+        print("Entity components imported at load time: " + ", ".join(platforms))
+        failed = True
+    if total > args.budget:
+        print("Import cost is over budget")
+        failed = True
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
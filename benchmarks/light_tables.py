@@ -0,0 +1,70 @@
+"""Benchmark the light lookup tables and check round-trip stability.
+
+Run with ``python benchmarks/light_tables.py``. The script exits non-zero
+if any HomeKit value changes after a round trip through Home Assistant.
+"""
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+import sys
+import timeit
+
+def _load_tables():
+    """Load light_tables.py without importing the integration package."""
+    path = Path(__file__).resolve().parent.parent / "light_tables.py"
+    spec = importlib.util.spec_from_file_location("light_tables", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def _check_stability(tables) -> list[str]:
+    """Return a description of every value that is not stable."""
+    failures = []
+    for pct in range(101):
+        if tables.brightness_to_pct(tables.pct_to_brightness(pct)) != pct:
+            failures.append(f"brightness {pct}%")
+    for brightness in range(256):
+        canonical = tables.canonical_brightness(brightness)
+        if tables.canonical_brightness(canonical) != canonical:
+            failures.append(f"brightness {brightness}")
+    for mired in range(tables.MIN_MIREDS, tables.MAX_MIREDS + 1):
+        if tables.kelvin_to_mired(tables.mired_to_kelvin(mired)) != mired:
+            failures.append(f"colour temperature {mired} mireds")
+    for hue in range(tables.MAX_HUE):
+        for saturation in range(tables.MAX_SATURATION + 1):
+            hs = tables.rgb_to_hs(*tables.hs_to_rgb(hue, saturation))
+            if tables.rgb_to_hs(*tables.hs_to_rgb(*hs)) != hs:
+                failures.append(f"colour {hue}/{saturation}")
+    return failures
+
+def main() -> int:
+    """Run the benchmark."""
+    tables = _load_tables()
+    start = timeit.default_timer()
+    tables.hs_to_rgb(0, 0)
+    build = timeit.default_timer() - start
+
+    def update() -> None:
+        tables.canonical_brightness(127)
+        tables.canonical_kelvin(2700)
+        tables.rgb_to_hs(255, 120, 10)
+
+    number = 200_000
+    per_update = timeit.timeit(update, number=number) / number
+    # Colours not yet in the cache go through the grid search
+    uncached = timeit.timeit(
+        lambda: tables.rgb_to_hs.__wrapped__(255, 120, 10), number=number
+    ) / number
+    failures = _check_stability(tables)
+
+    print(f"colour table build: {build * 1000:.1f} ms")
+    print(f"per-update conversion cost: {per_update * 1e6:.2f} us")
+    print(f"uncached colour conversion: {uncached * 1e6:.2f} us")
+    print(f"round-trip failures: {len(failures)}")
+    for failure in failures[:20]:
+        print(f"  unstable: {failure}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""Measure the memory held by each proxy entity.
+
+Run with ``python benchmarks/proxy_memory.py [count]`` in an environment
+with Home Assistant installed. Proxies are built for one entry without
+being added to hass, so the figures cover what the integration itself
+allocates per proxy on top of the shared per-entry context. The switch
+proxy is compared with a baseline built the way proxies were before the
+context was shared, holding their own DeviceInfo, identifiers and entry
+details. Home Assistant's Entity has no __slots__, so both still carry
+an instance __dict__.
+"""
+from __future__ import annotations
+
+import gc
+import importlib.util
+from pathlib import Path
+import sys
+from types import SimpleNamespace
+import tracemalloc
+
+ROOT = Path(__file__).resolve().parent.parent
+
+def _load_integration():
+    """Import the integration as the homekit_device package."""
+    spec = importlib.util.spec_from_file_location(
+        "homekit_device",
+        ROOT / "__init__.py",
+        submodule_search_locations=[str(ROOT)],
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["homekit_device"] = module
+    spec.loader.exec_module(module)
+    return module
+
+def _baseline_switch(switch_entity: type, device_info: type, domain: str) -> type:
+    """Return a switch proxy class holding its own device details."""
+
+    class BaselineSwitch(switch_entity):
+        """A switch proxy built before the per-entry context was shared."""
+
+        def __init__(self, entry_id: str, config: dict, name: str, entity_id: str) -> None:
+            """Initialize the switch from the entry's details."""
+            self._entry_id = entry_id
+            self._name = name
+            self._source_entity = entity_id
+            self._attr_unique_id = f"{domain}_{entry_id}_{entity_id}"
+            self._attr_name = name
+            self._attr_has_entity_name = True
+            self.device_type = config["device_type"]
+            self._attr_device_info = device_info(
+                identifiers={(domain, f"{domain}_{entry_id}")},
+                name=config["name"],
+                manufacturer="HomeKit Device Aggregator",
+                model=self.device_type.title(),
+                suggested_area="Kitchen" if self.device_type == "kettle" else None,
+                via_device=(domain, f"{domain}_{entry_id}"),
+            )
+            self._attr_should_poll = False
+            self._transform = None
+
+    return BaselineSwitch
+
+def _bytes_per_proxy(build, count: int) -> float:
+    """Return the bytes allocated per proxy when building count proxies."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    proxies = [build(index) for index in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    # The list holding the proxies is not part of their cost
+    allocated -= sys.getsizeof(proxies)
+    return allocated / count
+
+def main() -> int:
+    """Run the benchmark."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    _load_integration()
+    from homeassistant.components.switch import SwitchEntity
+    from homeassistant.helpers.entity import DeviceInfo
+
+    from homekit_device.const import DOMAIN
+    from homekit_device.models import HomeKitDeviceContext
+    from homekit_device.scheduler import UpdateScheduler
+    from homekit_device.sensor import HomeKitDeviceSensor
+    from homekit_device.switch import HomeKitDeviceSwitch
+
+    entry = SimpleNamespace(
+        entry_id="benchmark",
+        title="Benchmark",
+        data={"name": "Benchmark", "device_type": "kettle"},
+        options={},
+    )
+    context = HomeKitDeviceContext.from_entry(None, entry, UpdateScheduler(None))
+    baseline_switch = _baseline_switch(SwitchEntity, DeviceInfo, DOMAIN)
+
+    baseline = _bytes_per_proxy(
+        lambda index: baseline_switch(
+            entry.entry_id, entry.data, f"Proxy {index}", f"switch.source_{index}"
+        ),
+        count,
+    )
+    switch = _bytes_per_proxy(
+        lambda index: HomeKitDeviceSwitch(context, f"Proxy {index}", f"switch.source_{index}"),
+        count,
+    )
+    sensor = _bytes_per_proxy(
+        lambda index: HomeKitDeviceSensor(
+            context, f"Proxy {index}", f"sensor.source_{index}", "°C"
+        ),
+        count,
+    )
+
+    print(f"bytes per proxy at {count} proxies:")
+    print(f"  baseline switch, own device info: {baseline:.0f}")
+    print(f"  HomeKitDeviceSwitch, shared context: {switch:.0f}")
+    print(f"  saved per switch: {baseline - switch:.0f} ({1 - switch / baseline:.0%})")
+    print(f"  HomeKitDeviceSensor, shared context: {sensor:.0f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
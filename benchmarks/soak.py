@@ -0,0 +1,308 @@
+"""Check that reloading entries leaks no listeners, proxies or memory.
+
+Run with ``python benchmarks/soak.py [--cycles N] [--events N] [--seed N]``
+in an environment with Home Assistant installed. The script starts a
+local Home Assistant with the integration as a custom component and
+creates one entry of every device type through the config flow, backed
+by plain states in the state machine. Each cycle sets the entries up,
+drives seeded source updates and proxy commands through them, and
+unloads them again.
+
+The cyclic garbage collector is disabled while the cycles run. After
+an unload the script first counts the proxies still alive, which must
+have been freed by reference counting alone. It then collects garbage,
+and counts event bus listeners, keyed state change callbacks, timers
+and tasks owned by the integration, services, and the proxies that
+survived even that. No count may rise above its level after the warm-up
+cycles, no proxy may survive its entry, and the resident set may grow
+by no more than the budget per cycle.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import importlib
+import itertools
+import os
+from pathlib import Path
+import random
+import resource
+import sys
+import tempfile
+import weakref
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = "homekit_device"
+DEFAULT_CYCLES = 1000
+DEFAULT_EVENTS = 20
+DEFAULT_WARMUP = 10
+DEFAULT_RSS_BUDGET_KIB = 1.0
+DEFAULT_SEED = 0
+INTEGRATION = f"custom_components.{PACKAGE}"
+
+# States cycled through by the sources of each domain
+DOMAIN_STATES = {
+    "switch": ("on", "off"),
+    "binary_sensor": ("on", "off"),
+    "light": ("on", "off"),
+    "select": ("Forward", "Reverse"),
+    "cover": ("opening", "open", "closing", "closed"),
+    "alarm_control_panel": ("disarmed", "armed_away", "armed_home", "triggered"),
+    "text": ("255,0,0", "0,255,0", "0,0,255"),
+}
+NUMBER_ATTRIBUTES = {"min": 0, "max": 100, "step": 1}
+SELECT_ATTRIBUTES = {"options": ["Forward", "Reverse"]}
+
+def _rss_kib() -> float:
+    """Return the current resident set size in KiB."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024
+    except OSError:
+        # Peak rather than current, but it still only grows with a leak
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+def _source_state(entity_id: str, step: int) -> tuple[str, dict]:
+    """Return the state and attributes of a source at a step of the load."""
+    domain = entity_id.split(".", 1)[0]
+    if states := DOMAIN_STATES.get(domain):
+        attributes = SELECT_ATTRIBUTES if domain == "select" else {}
+        return states[step % len(states)], attributes
+    if step % 10 == 9:
+        return "unavailable", {}
+    return str(round(random.uniform(0, 100), 1)), NUMBER_ATTRIBUTES
+
+def _owned(obj: object, depth: int = 4) -> bool:
+    """Return if a callback, or what it wraps or is bound to, is the integration's."""
+    if obj is None or depth == 0:
+        return False
+    module = getattr(obj, "__module__", None) or type(obj).__module__
+    if isinstance(module, str) and module.startswith(INTEGRATION):
+        return True
+    # Unwrap partials, bound methods, HassJobs and the handles of timers and tasks
+    for attr in ("func", "__self__", "target", "action", "job", "_callback"):
+        if (inner := getattr(obj, attr, None)) is not None and inner is not obj:
+            if _owned(inner, depth - 1):
+                return True
+    args = getattr(obj, "args", None) or getattr(obj, "_args", None) or ()
+    return isinstance(args, tuple) and any(_owned(arg, depth - 1) for arg in args)
+
+def _task_owned(task: asyncio.Task) -> bool:
+    """Return if a task runs a coroutine of the integration."""
+    frame = getattr(task.get_coro(), "cr_frame", None)
+    return frame is not None and frame.f_globals.get("__name__", "").startswith(INTEGRATION)
+
+def _device_sources(device_type: str, get_device_schema) -> dict:
+    """Return the mapping of an entry with a fake source for every field."""
+    mapping = {}
+    for marker, entity_selector in get_device_schema(device_type).items():
+        domain = entity_selector.config["domain"]
+        entity_id = f"{domain}.soak_{device_type}_{marker.schema}"
+        if entity_selector.config.get("multiple"):
+            mapping[marker.schema] = [f"{entity_id}_{index}" for index in range(3)]
+        else:
+            mapping[marker.schema] = entity_id
+    return mapping
+
+def _sources(mapping: dict) -> list[str]:
+    """Return every source entity of a mapping."""
+    return list(
+        itertools.chain.from_iterable(
+            value if isinstance(value, list) else [value] for value in mapping.values()
+        )
+    )
+
+class Soak:
+    """A local Home Assistant with one entry of every device type."""
+
+    def __init__(self, config_dir: str) -> None:
+        """Initialize the soak run."""
+        self.config_dir = config_dir
+        self.hass = None
+        self.entries: dict[str, list[str]] = {}
+        self.proxies: weakref.WeakSet = weakref.WeakSet()
+        self._entity_base = None
+
+    async def async_start(self) -> None:
+        """Start Home Assistant and create the entries."""
+        from homeassistant import bootstrap, loader
+        from homeassistant.config_entries import ConfigEntries
+        from homeassistant.core import HomeAssistant
+        from homeassistant.setup import async_setup_component
+
+        custom_components = Path(self.config_dir) / "custom_components"
+        custom_components.mkdir()
+        os.symlink(ROOT, custom_components / PACKAGE)
+
+        hass = self.hass = HomeAssistant(self.config_dir)
+        hass.config.skip_pip = True
+        loader.async_setup(hass)
+        await bootstrap.async_load_base_functionality(hass)
+        hass.config_entries = ConfigEntries(hass, {})
+        await hass.config_entries.async_initialize()
+        await hass.async_start()
+        assert await async_setup_component(hass, PACKAGE, {})
+
+        config_flow = importlib.import_module(f"{INTEGRATION}.config_flow")
+        const = importlib.import_module(f"{INTEGRATION}.const")
+        self._entity_base = importlib.import_module(f"{INTEGRATION}.entity").HomeKitDeviceBaseEntity
+
+        for device_type in const.DEVICE_TYPES:
+            mapping = _device_sources(device_type, config_flow.get_device_schema)
+            sources = _sources(mapping)
+            for entity_id in sources:
+                hass.states.async_set(entity_id, *_source_state(entity_id, 0))
+
+            flow = await hass.config_entries.flow.async_init(
+                PACKAGE, context={"source": "user"}
+            )
+            flow = await hass.config_entries.flow.async_configure(
+                flow["flow_id"], {"next_step_id": "manual"}
+            )
+            flow = await hass.config_entries.flow.async_configure(
+                flow["flow_id"],
+                {const.CONF_NAME: f"Soak {device_type}", const.CONF_DEVICE_TYPE: device_type},
+            )
+            result = await hass.config_entries.flow.async_configure(
+                flow["flow_id"], mapping
+            )
+            self.entries[result["result"].entry_id] = sources
+        await hass.async_block_till_done()
+        await self.async_unload()
+
+    async def async_stop(self) -> None:
+        """Stop Home Assistant."""
+        await self.hass.async_stop(force=True)
+
+    async def async_setup(self) -> None:
+        """Set every entry up and remember its proxies."""
+        for entry_id in self.entries:
+            assert await self.hass.config_entries.async_setup(entry_id)
+        await self.hass.async_block_till_done()
+        for obj in gc.get_objects():
+            if isinstance(obj, self._entity_base):
+                self.proxies.add(obj)
+
+    async def async_unload(self) -> None:
+        """Unload every entry."""
+        for entry_id in self.entries:
+            assert await self.hass.config_entries.async_unload(entry_id)
+        await self.hass.async_block_till_done()
+
+    async def async_load(self, events: int) -> None:
+        """Drive source updates, availability changes and proxy commands."""
+        hass = self.hass
+        for step in range(1, events + 1):
+            for sources in self.entries.values():
+                for entity_id in sources:
+                    hass.states.async_set(entity_id, *_source_state(entity_id, step))
+            await asyncio.sleep(0)
+
+        # Commands go through the proxies to the source domain services
+        for domain in ("switch", "fan", "humidifier"):
+            proxies = [
+                state.entity_id
+                for state in hass.states.async_all(domain)
+                if state.attributes.get("friendly_name", "").startswith("Soak ")
+            ]
+            if proxies:
+                await hass.services.async_call(
+                    domain, "toggle", {"entity_id": proxies}, blocking=True
+                )
+        await hass.async_block_till_done()
+
+    def counts(self) -> dict[str, int]:
+        """Return the counts that must not grow across cycles."""
+        from homeassistant.helpers import event
+
+        hass = self.hass
+        tracked = hass.data.get(getattr(event, "_TRACK_STATE_CHANGE_DATA", None), {})
+        # Proxies must not need the cyclic collector to be freed
+        uncollected = len(self.proxies)
+        gc.collect()
+        return {
+            "bus listeners": sum(hass.bus.async_listeners().values()),
+            "state callbacks": sum(len(jobs) for jobs in tracked.values()),
+            # Home Assistant's own timers and tasks come and go with its loop activity
+            "timers": sum(
+                1 for timer in getattr(hass.loop, "_scheduled", ()) if _owned(timer)
+            ),
+            "tasks": sum(1 for task in asyncio.all_tasks() if _task_owned(task)),
+            "services": sum(len(services) for services in hass.services.async_services().values()),
+            "uncollected proxies": uncollected,
+            "live proxies": len(self.proxies),
+        }
+
+async def _async_run(args: argparse.Namespace) -> int:
+    """Run the soak cycles and compare the counts."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        soak = Soak(config_dir)
+        await soak.async_start()
+        gc.disable()
+        try:
+            for _ in range(args.warmup):
+                await soak.async_setup()
+                await soak.async_load(args.events)
+                await soak.async_unload()
+            baseline = soak.counts()
+            baseline_rss = _rss_kib()
+            print(f"{len(soak.entries)} entries, baseline after {args.warmup} warm-up cycles:")
+            for name, count in baseline.items():
+                print(f"  {name}: {count}")
+
+            failed = False
+            counts, rss_per_cycle = baseline, 0.0
+            for cycle in range(1, args.cycles + 1):
+                await soak.async_setup()
+                await soak.async_load(args.events)
+                await soak.async_unload()
+                if cycle % args.report and cycle != args.cycles:
+                    continue
+                counts = soak.counts()
+                growth = {
+                    name: count - baseline[name]
+                    for name, count in counts.items()
+                    if count > baseline[name]
+                }
+                rss_per_cycle = (_rss_kib() - baseline_rss) / cycle
+                print(
+                    f"cycle {cycle}: {rss_per_cycle:+.2f} KiB RSS per cycle"
+                    + "".join(f", {name} {change:+d}" for name, change in growth.items())
+                )
+                if growth:
+                    failed = True
+            if rss_per_cycle > args.rss_budget:
+                print(f"RSS grew by more than {args.rss_budget} KiB per cycle")
+                failed = True
+            if counts["uncollected proxies"]:
+                print(f"{counts['uncollected proxies']} proxies were left for the garbage collector")
+                failed = True
+            if counts["live proxies"]:
+                print(f"{counts['live proxies']} proxies outlived their entry")
+                failed = True
+        finally:
+            gc.enable()
+            await soak.async_stop()
+    return 1 if failed else 0
+
+def main() -> int:
+    """Run the soak test."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cycles", type=int, default=DEFAULT_CYCLES)
+    parser.add_argument("--events", type=int, default=DEFAULT_EVENTS)
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP)
+    parser.add_argument("--report", type=int, default=100, help="cycles between reports")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="seed of the source values")
+    parser.add_argument(
+        "--rss-budget",
+        type=float,
+        default=DEFAULT_RSS_BUDGET_KIB,
+        help="allowed RSS growth per cycle in KiB",
+    )
+    args = parser.parse_args()
+    random.seed(args.seed)
+    return asyncio.run(_async_run(args))
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,27 +1,179 @@
 """Platform for binary sensor integration."""
 from __future__ import annotations
 
-from homeassistant.components.binary_sensor import BinarySensorEntity
+from functools import partial
+from typing import Any
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import STATE_ON, EntityCategory
+from homeassistant.core import HomeAssistant, State, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
     DOMAIN,
     CONF_NAME,
+    CONF_POWER_SWITCH,
+    CONF_CURRENT_TEMP,
+    CONF_TARGET_TEMP,
     CONF_OBSTRUCTION,
     CONF_MOTION,
     CONF_SENSORS,
+    CONF_FILTER_LIFE,
+    FILTER_CHANGE_THRESHOLD,
+    HEATING_HYSTERESIS,
+)
+from .entity import (
+    HomeKitDeviceBaseEntity,
+    HomeKitDeviceCompositeEntity,
+    HomeKitDeviceEntity,
 )
-from .entity import HomeKitDeviceEntity
+from .homekit_type import CHAR_HEATING_COOLING_CURRENT
+from .models import HomeKitDeviceContext
+from .scheduler import UpdatePriority
+from .transforms import Transform, to_float
 
 class HomeKitDeviceBinarySensor(HomeKitDeviceEntity, BinarySensorEntity):
     """Representation of a HomeKit Device binary sensor."""
 
-    async def async_update_from_source(self, state) -> None:
-        """Update the entity from the source entity state."""
-        self._attr_is_on = state.state == "on"
-        self.async_write_ha_state()
+    @callback
+    def async_apply_source(self, state: State) -> bool:
+        """Apply the source entity state."""
+        self._attr_is_on = self._transform(state.state) == "on"
+        return True
+
+class HomeKitDeviceFilterChangeSensor(HomeKitDeviceEntity, BinarySensorEntity):
+    """Reports when an air purifier's filter needs changing.
+
+    On once the filter life source is at FILTER_CHANGE_THRESHOLD percent or
+    less, so the HomeKit bridge can link it as the purifier's filter change
+    indication. The state is only written when it changes.
+    """
+
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+
+    def __init__(self, context: HomeKitDeviceContext, name: str, entity_id: str) -> None:
+        """Initialize the filter change sensor."""
+        super().__init__(context, name, entity_id)
+        self._attr_unique_id = f"{context.identifier}_{entity_id}_change"
+
+    def _default_transform(self) -> Transform:
+        """Return the transform used when none is configured for the mapping."""
+        return to_float
+
+    @callback
+    def async_apply_source(self, state: State) -> bool:
+        """Apply the source entity state."""
+        life = self._transform(state.state)
+        is_on = None if life is None else life <= FILTER_CHANGE_THRESHOLD
+        if is_on == self._attr_is_on:
+            return False
+        self._attr_is_on = is_on
+        return True
+
+class HomeKitDeviceKettleHeatingSensor(HomeKitDeviceCompositeEntity, BinarySensorEntity):
+    """Reports whether a kettle is heating, derived from its sources.
+
+    The kettle heats while it is on and below its target temperature.
+    Once the target is reached it is idle until the water cools more
+    than HEATING_HYSTERESIS degrees below the target, so the state does
+    not flap around the setpoint. The state is only written when it
+    changes.
+    """
+
+    __slots__ = ("_power_on", "_current", "_target")
+
+    _attr_device_class = BinarySensorDeviceClass.HEAT
+    _attr_translation_key = "heating"
+    _attr_homekit_char = CHAR_HEATING_COOLING_CURRENT
+
+    def __init__(
+        self,
+        context: HomeKitDeviceContext,
+        name: str,
+        power: str,
+        current: str,
+        target: str,
+    ) -> None:
+        """Initialize the heating sensor."""
+        super().__init__(context, name, power)
+        self._attr_unique_id = f"{context.identifier}_heating"
+        self._attr_is_on = False
+        self._power_on = False
+        self._current: float | None = None
+        self._target: float | None = None
+        self._add_source(power, self._apply_power)
+        self._add_source(current, self._apply_current, to_float)
+        self._add_source(target, self._apply_target, to_float)
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return the HomeKit current heating state, 0 idle and 1 heating."""
+        return {"current_heating_cooling_state": int(bool(self._attr_is_on))}
+
+    def _apply_power(self, state: State, value: Any) -> None:
+        self._power_on = value == STATE_ON
+        self._update_heating()
+
+    def _apply_current(self, state: State, value: float | None) -> None:
+        self._current = value
+        self._update_heating()
+
+    def _apply_target(self, state: State, value: float | None) -> None:
+        self._target = value
+        self._update_heating()
+
+    def _update_heating(self) -> None:
+        """Move between heating and idle when a threshold is crossed."""
+        if not self._power_on or self._current is None or self._target is None:
+            self._attr_is_on = False
+        elif self._current >= self._target:
+            self._attr_is_on = False
+        elif self._current < self._target - HEATING_HYSTERESIS:
+            self._attr_is_on = True
+
+    def _build_snapshot(self) -> tuple:
+        """Return the heating state."""
+        return (self._attr_is_on,)
+
+class HomeKitDeviceHealthSensor(HomeKitDeviceBaseEntity, BinarySensorEntity):
+    """Reports whether any source of an aggregated device is unavailable."""
+
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    update_priority = UpdatePriority.TELEMETRY
+
+    def __init__(self, context: HomeKitDeviceContext, name: str) -> None:
+        """Initialize the health sensor."""
+        super().__init__(context, name, "health")
+
+    @property
+    def is_on(self) -> bool:
+        """Return if the device is degraded."""
+        return self._context.health.degraded
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return the availability counters."""
+        health = self._context.health
+        return {
+            "device_available": health.available,
+            "required_unavailable": health.required_unavailable,
+            "optional_unavailable": health.optional_unavailable,
+            "unavailable_sources": sorted(health.unavailable),
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """Run when entity is added to hass."""
+        scheduler = self._context.scheduler
+        self.async_on_remove(
+            self._context.health.async_add_listener(partial(scheduler.async_write, self))
+        )
+        self.async_on_remove(partial(scheduler.async_cancel, self))
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -29,17 +181,32 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the HomeKit Device binary sensors."""
-    device_type = hass.data[DOMAIN][config_entry.entry_id]["device_type"]
+    context: HomeKitDeviceContext = hass.data[DOMAIN][config_entry.entry_id]
+    device_type = context.device_type
     base_name = config_entry.data.get(CONF_NAME, "Smart Device")
-    entities = []
+    entities = [HomeKitDeviceHealthSensor(context, f"{base_name} Health")]
 
     # Device-specific binary sensors
-    if device_type == "garage_door":
+    if device_type == "kettle":
+        power = config_entry.data.get(CONF_POWER_SWITCH)
+        current_temp = config_entry.data.get(CONF_CURRENT_TEMP)
+        target_temp = config_entry.data.get(CONF_TARGET_TEMP)
+        if power and current_temp and target_temp:
+            entities.append(
+                HomeKitDeviceKettleHeatingSensor(
+                    context,
+                    f"{base_name} Heating",
+                    power,
+                    current_temp,
+                    target_temp,
+                )
+            )
+
+    elif device_type == "garage_door":
         if obstruction := config_entry.data.get(CONF_OBSTRUCTION):
             entities.append(
                 HomeKitDeviceBinarySensor(
-                    hass,
-                    config_entry.entry_id,
+                    context,
                     f"{base_name} Obstruction",
                     obstruction,
                 )
@@ -47,24 +214,31 @@ async def async_setup_entry(
         if motion := config_entry.data.get(CONF_MOTION):
             entities.append(
                 HomeKitDeviceBinarySensor(
-                    hass,
-                    config_entry.entry_id,
+                    context,
                     f"{base_name} Motion",
                     motion,
                 )
             )
 
+    elif device_type == "air_purifier":
+        if filter_life := config_entry.data.get(CONF_FILTER_LIFE):
+            entities.append(
+                HomeKitDeviceFilterChangeSensor(
+                    context,
+                    f"{base_name} Filter Change",
+                    filter_life,
+                )
+            )
+
     elif device_type == "security_system":
         if sensors := config_entry.data.get(CONF_SENSORS):
             for i, sensor in enumerate(sensors, 1):
                 entities.append(
                     HomeKitDeviceBinarySensor(
-                        hass,
-                        config_entry.entry_id,
+                        context,
                         f"{base_name} Sensor {i}",
                         sensor,
                     )
                 )
 
-    if entities:
-        async_add_entities(entities)
+    async_add_entities(entities)
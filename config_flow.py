@@ -12,38 +12,31 @@ from .const import (
     DOMAIN,
     CONF_NAME,
     CONF_DEVICE_TYPE,
-    CONF_POWER_SWITCH,
-    CONF_TEMP_SENSORS,
-    CONF_TARGET_TEMP,
-    CONF_CURRENT_TEMP,
-    CONF_STATUS_SENSOR,
-    CONF_COUNTDOWN,
-    CONF_FAULT,
-    CONF_KEEP_WARM,
-    CONF_KEEP_WARM_TIME,
-    CONF_SPEED_CONTROL,
-    CONF_OSCILLATION,
-    CONF_DIRECTION,
-    CONF_BRIGHTNESS,
-    CONF_COLOR_TEMP,
-    CONF_RGB_CONTROL,
-    CONF_CURRENT_HUMIDITY,
-    CONF_TARGET_HUMIDITY,
-    CONF_WATER_LEVEL,
-    CONF_AIR_QUALITY,
-    CONF_FILTER_LIFE,
-    CONF_PM25,
-    CONF_VOC,
-    CONF_DOOR_POSITION,
-    CONF_OBSTRUCTION,
-    CONF_MOTION,
-    CONF_LIGHT_SWITCH,
-    CONF_ALARM_STATE,
-    CONF_SENSORS,
-    CONF_SIREN,
+    CONF_CANDIDATE,
+    CONF_TRANSFORMS,
+    CONF_MAPPING,
+    CONF_SCALE,
+    CONF_OFFSET,
+    CONF_CONVERSION,
+    CONF_VALUE_MAP,
+    CONF_CLAMP,
+    CONF_EXPRESSION,
+    CONF_WINDOWS,
     DEVICE_TYPES,
     DEFAULT_NAME,
 )
+from .device_fields import get_device_fields
+from .discovery import DiscoveryCandidate, async_discover_candidates
+from .homekit_type import get_characteristic
+from .rolling import parse_windows
+from .transforms import (
+    UNIT_CONVERSIONS,
+    InvalidTransform,
+    compile_transform,
+    parse_value_map,
+)
+
+CONVERSION_NONE = "none"
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for HomeKit Device Aggregator."""
@@ -53,11 +46,70 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self) -> None:
         """Initialize config flow."""
         self._data: Dict[str, Any] = {}
+        self._suggested: Dict[str, Any] = {}
+        self._candidates: list[DiscoveryCandidate] = []
 
     async def async_step_user(
         self, user_input: Optional[Dict[str, Any]] = None
     ) -> FlowResult:
         """Handle the initial step."""
+        return self.async_show_menu(
+            step_id="user",
+            menu_options=["discover", "manual"],
+        )
+
+    async def async_step_discover(
+        self, user_input: Optional[Dict[str, Any]] = None
+    ) -> FlowResult:
+        """Suggest devices built from entities that look like they belong together."""
+        errors = {}
+
+        if user_input is not None:
+            candidate = self._candidates[int(user_input[CONF_CANDIDATE])]
+            self._data.update(
+                {
+                    CONF_NAME: candidate.name,
+                    CONF_DEVICE_TYPE: candidate.device_type,
+                }
+            )
+            self._suggested = candidate.mapping
+            return await self.async_step_device_config()
+
+        self._candidates = async_discover_candidates(
+            self.hass,
+            {device_type: get_device_schema(device_type) for device_type in DEVICE_TYPES},
+        )
+        if not self._candidates:
+            return self.async_abort(reason="no_candidates")
+
+        return self.async_show_form(
+            step_id="discover",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_CANDIDATE): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=[
+                                selector.SelectOptionDict(
+                                    value=str(index),
+                                    label=(
+                                        f"{candidate.name}: {candidate.entity_count} "
+                                        f"entities as {candidate.device_type.replace('_', ' ')}"
+                                    ),
+                                )
+                                for index, candidate in enumerate(self._candidates)
+                            ],
+                            mode=selector.SelectSelectorMode.LIST,
+                        ),
+                    ),
+                }
+            ),
+            errors=errors,
+        )
+
+    async def async_step_manual(
+        self, user_input: Optional[Dict[str, Any]] = None
+    ) -> FlowResult:
+        """Handle manual selection of the name and device type."""
         errors = {}
 
         if user_input is not None:
@@ -65,7 +117,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return await self.async_step_device_config()
 
         return self.async_show_form(
-            step_id="user",
+            step_id="manual",
             data_schema=vol.Schema(
                 {
                     vol.Required(CONF_NAME, default=DEFAULT_NAME): str,
@@ -97,133 +149,167 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         schema = self._get_device_schema()
         return self.async_show_form(
             step_id="device_config",
-            data_schema=vol.Schema(schema),
+            data_schema=self.add_suggested_values_to_schema(
+                vol.Schema(schema), self._suggested
+            ),
             errors=errors,
         )
 
     def _get_device_schema(self) -> dict:
         """Get the configuration schema for the selected device type."""
-        device_type = self._data[CONF_DEVICE_TYPE]
-        base_schema = {
-            vol.Required(CONF_POWER_SWITCH): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="switch")
+        return get_device_schema(self._data[CONF_DEVICE_TYPE])
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> config_entries.OptionsFlow:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler(config_entry)
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle per-mapping value transforms and statistics for an aggregated device."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self._entry = config_entry
+        self._transforms: Dict[str, Any] = dict(
+            config_entry.options.get(CONF_TRANSFORMS, {})
+        )
+        self._windows: Dict[str, list[int]] = dict(
+            config_entry.options.get(CONF_WINDOWS, {})
+        )
+        self._mapping: str | None = None
+
+    async def async_step_init(
+        self, user_input: Optional[Dict[str, Any]] = None
+    ) -> FlowResult:
+        """Select the mapping to transform."""
+        if user_input is not None:
+            self._mapping = user_input[CONF_MAPPING]
+            return await self.async_step_transform()
+
+        mappings = [
+            key
+            for key, value in self._entry.data.items()
+            if key not in (CONF_NAME, CONF_DEVICE_TYPE) and value
+        ]
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_MAPPING): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=mappings,
+                            translation_key="mapping",
+                            mode=selector.SelectSelectorMode.DROPDOWN,
+                        ),
+                    ),
+                }
             ),
-            vol.Optional(CONF_STATUS_SENSOR): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="sensor")
+        )
+
+    async def async_step_transform(
+        self, user_input: Optional[Dict[str, Any]] = None
+    ) -> FlowResult:
+        """Configure the value transform and statistics for the selected mapping."""
+        errors = {}
+        current = self._transforms.get(self._mapping, {})
+
+        if user_input is not None:
+            spec: Dict[str, Any] = {}
+            try:
+                windows = parse_windows(user_input.get(CONF_WINDOWS, ""))
+            except ValueError:
+                errors[CONF_WINDOWS] = "invalid_windows"
+            try:
+                if value_map := parse_value_map(user_input.get(CONF_VALUE_MAP, "")):
+                    spec[CONF_VALUE_MAP] = value_map
+                if (conversion := user_input.get(CONF_CONVERSION)) != CONVERSION_NONE:
+                    spec[CONF_CONVERSION] = conversion
+                if user_input.get(CONF_SCALE, 1) != 1:
+                    spec[CONF_SCALE] = user_input[CONF_SCALE]
+                if user_input.get(CONF_OFFSET, 0) != 0:
+                    spec[CONF_OFFSET] = user_input[CONF_OFFSET]
+                if expression := user_input.get(CONF_EXPRESSION, "").strip():
+                    spec[CONF_EXPRESSION] = expression
+                if user_input.get(CONF_CLAMP):
+                    spec[CONF_CLAMP] = True
+                # Compile once here so invalid specs never reach setup
+                compile_transform(
+                    spec,
+                    get_characteristic(self._entry.data[CONF_DEVICE_TYPE], self._mapping),
+                )
+            except InvalidTransform:
+                errors["base"] = "invalid_transform"
+            if not errors:
+                if spec:
+                    self._transforms[self._mapping] = spec
+                else:
+                    self._transforms.pop(self._mapping, None)
+                if windows:
+                    self._windows[self._mapping] = windows
+                else:
+                    self._windows.pop(self._mapping, None)
+                return self.async_create_entry(
+                    title="",
+                    data={
+                        **self._entry.options,
+                        CONF_TRANSFORMS: self._transforms,
+                        CONF_WINDOWS: self._windows,
+                    },
+                )
+
+        return self.async_show_form(
+            step_id="transform",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_VALUE_MAP,
+                        default=", ".join(
+                            f"{source}={target}"
+                            for source, target in current.get(CONF_VALUE_MAP, {}).items()
+                        ),
+                    ): str,
+                    vol.Optional(
+                        CONF_CONVERSION,
+                        default=current.get(CONF_CONVERSION, CONVERSION_NONE),
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=[CONVERSION_NONE, *UNIT_CONVERSIONS],
+                            translation_key="conversion",
+                            mode=selector.SelectSelectorMode.DROPDOWN,
+                        ),
+                    ),
+                    vol.Optional(
+                        CONF_SCALE, default=current.get(CONF_SCALE, 1.0)
+                    ): vol.Coerce(float),
+                    vol.Optional(
+                        CONF_OFFSET, default=current.get(CONF_OFFSET, 0.0)
+                    ): vol.Coerce(float),
+                    vol.Optional(
+                        CONF_EXPRESSION, default=current.get(CONF_EXPRESSION, "")
+                    ): str,
+                    vol.Optional(
+                        CONF_CLAMP, default=current.get(CONF_CLAMP, False)
+                    ): bool,
+                    vol.Optional(
+                        CONF_WINDOWS,
+                        default=", ".join(
+                            str(minutes) for minutes in self._windows.get(self._mapping, [])
+                        ),
+                    ): str,
+                }
             ),
-        }
-
-        device_schemas = {
-            "kettle": {
-                vol.Optional(CONF_CURRENT_TEMP): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Optional(CONF_TARGET_TEMP): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="input_number")
-                ),
-                vol.Optional(CONF_COUNTDOWN): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Optional(CONF_FAULT): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Optional(CONF_KEEP_WARM): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="switch")
-                ),
-            },
-            "thermostat": {
-                vol.Required(CONF_CURRENT_TEMP): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Required(CONF_TARGET_TEMP): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="number")
-                ),
-                vol.Optional(CONF_TEMP_SENSORS): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="sensor",
-                        multiple=True,
-                    )
-                ),
-            },
-            "fan": {
-                vol.Optional(CONF_SPEED_CONTROL): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="number")
-                ),
-                vol.Optional(CONF_OSCILLATION): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="switch")
-                ),
-                vol.Optional(CONF_DIRECTION): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="select")
-                ),
-            },
-            "light": {
-                vol.Optional(CONF_BRIGHTNESS): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="number")
-                ),
-                vol.Optional(CONF_COLOR_TEMP): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="number")
-                ),
-                vol.Optional(CONF_RGB_CONTROL): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="text")
-                ),
-            },
-            "humidifier": {
-                vol.Required(CONF_CURRENT_HUMIDITY): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Required(CONF_TARGET_HUMIDITY): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="number")
-                ),
-                vol.Optional(CONF_WATER_LEVEL): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-            },
-            "air_purifier": {
-                vol.Required(CONF_AIR_QUALITY): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Optional(CONF_FILTER_LIFE): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Optional(CONF_PM25): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Optional(CONF_VOC): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-            },
-            "garage_door": {
-                vol.Required(CONF_DOOR_POSITION): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="cover")
-                ),
-                vol.Optional(CONF_OBSTRUCTION): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="binary_sensor")
-                ),
-                vol.Optional(CONF_MOTION): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="binary_sensor")
-                ),
-                vol.Optional(CONF_LIGHT_SWITCH): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="light")
-                ),
-            },
-            "security_system": {
-                vol.Required(CONF_ALARM_STATE): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="alarm_control_panel")
-                ),
-                vol.Optional(CONF_SENSORS): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="binary_sensor",
-                        multiple=True,
-                    )
-                ),
-                vol.Optional(CONF_SIREN): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="switch")
-                ),
-            },
-        }
-
-        schema = base_schema.copy()
-        if device_type in device_schemas:
-            schema.update(device_schemas[device_type])
-
-        return schema
+            description_placeholders={"mapping": self._mapping},
+            errors=errors,
+        )
+
+def get_device_schema(device_type: str) -> dict:
+    """Get the configuration schema for a device type."""
+    return {
+        (vol.Required if field.required else vol.Optional)(key): selector.EntitySelector(
+            selector.EntitySelectorConfig(domain=field.domain, multiple=field.multiple)
+        )
+        for key, field in get_device_fields(device_type).items()
+    }
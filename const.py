@@ -3,16 +3,21 @@ DOMAIN = "homekit_device"
 CONF_ENTITIES = "entities"
 CONF_NAME = "name"
 CONF_DEVICE_TYPE = "device_type"
+CONF_CANDIDATE = "candidate"
 
-# HomeKit Accessory Categories
-CATEGORY_KETTLE = 27  # HomeKit category for kettles
+# hass.data key of the update scheduler shared by every entry
+DATA_SCHEDULER = f"{DOMAIN}_scheduler"
+
+# HomeKit Accessory Categories (HAP-python Category)
+# HAP has no kettle category; a kettle's primary service is a thermostat
+CATEGORY_KETTLE = 9
 CATEGORY_THERMOSTAT = 9
 CATEGORY_FAN = 3
 CATEGORY_LIGHTBULB = 5
-CATEGORY_HUMIDIFIER = 29
-CATEGORY_AIR_PURIFIER = 28
+CATEGORY_HUMIDIFIER = 22
+CATEGORY_AIR_PURIFIER = 19
 CATEGORY_GARAGE_DOOR = 4
-CATEGORY_SECURITY_SYSTEM = 7
+CATEGORY_SECURITY_SYSTEM = 11
 
 # HomeKit Features and Characteristics
 CHAR_ON = "on"
@@ -55,6 +60,13 @@ CONF_FAULT = "fault_status"
 CONF_KEEP_WARM = "keep_warm_mode"
 CONF_KEEP_WARM_TIME = "keep_warm_idle_time"
 
+# Degrees below the target temperature at which a kettle is reported heating again
+HEATING_HYSTERESIS = 2.0
+
+# Seconds a countdown source may drift from the extrapolated end time before resyncing.
+# Whole-minute reports move the implied end time by up to a minute, plus a margin.
+COUNTDOWN_RESYNC_TOLERANCE = 75
+
 # Temperature related configs
 CONF_TEMP_SENSORS = "temperature_sensors"  # For multiple temp sensors
 
@@ -79,12 +91,21 @@ CONF_AIR_QUALITY = "air_quality"
 CONF_FILTER_LIFE = "filter_life"
 CONF_PM25 = "pm25"
 CONF_VOC = "voc"
+FILTER_CHANGE_THRESHOLD = 10  # Filter life percentage at which HomeKit asks for a change
 
 # Garage door related configs
 CONF_DOOR_POSITION = "door_position"
 CONF_OBSTRUCTION = "obstruction_detected"
 CONF_MOTION = "motion_sensor"
 CONF_LIGHT_SWITCH = "light_switch"
+DEFAULT_TRAVEL_TIME = 15.0  # Seconds, until a full open or close has been seen
+
+# HomeKit CurrentDoorState and TargetDoorState values
+DOOR_STATE_OPEN = 0
+DOOR_STATE_CLOSED = 1
+DOOR_STATE_OPENING = 2
+DOOR_STATE_CLOSING = 3
+DOOR_STATE_STOPPED = 4
 
 # Security system related configs
 CONF_ALARM_STATE = "alarm_state"
@@ -92,5 +113,36 @@ CONF_SENSORS = "sensors"  # List of security sensors
 CONF_SIREN = "siren"
 CONF_KEYPAD = "keypad"
 
+# Options
+CONF_TRANSFORMS = "transforms"
+CONF_MAPPING = "mapping"
+CONF_SCALE = "scale"
+CONF_OFFSET = "offset"
+CONF_CONVERSION = "conversion"
+CONF_VALUE_MAP = "value_map"
+CONF_CLAMP = "clamp"
+CONF_EXPRESSION = "expression"
+CONF_WINDOWS = "windows"  # Rolling statistics window lengths in minutes
+VALUE_MAP_DEFAULT = "*"  # Value map key matching any unmapped source value
+
+# Seconds to wait for source entities before hydrating proxies without them
+HYDRATION_TIMEOUT = 30
+
+# Queued telemetry updates across the integration before the oldest are shed
+TELEMETRY_QUEUE_SIZE = 256
+# Telemetry updates written before yielding to other work on the event loop
+TELEMETRY_BATCH_SIZE = 16
+
+# Integration-wide budget for proxy state writes, set in configuration.yaml
+CONF_WRITE_RATE = "write_rate"
+CONF_WRITE_BURST = "write_burst"
+DEFAULT_WRITE_RATE = 50.0  # Writes per second
+DEFAULT_WRITE_BURST = 100
+
+# Services
+SERVICE_BRIDGE_SHARDS = "bridge_shards"
+CONF_SHARDS = "shards"
+CONF_PREVIOUS_SHARDS = "previous_shards"
+
 # Default values
 DEFAULT_NAME = "Aggregated Device"
@@ -0,0 +1,319 @@
+"""Platform for cover integration."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from homeassistant.components.cover import (
+    CoverDeviceClass,
+    CoverEntity,
+    CoverEntityFeature,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import STATE_ON
+from homeassistant.core import HomeAssistant, State, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import (
+    async_track_state_change,
+    async_track_time_interval,
+)
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    CONF_NAME,
+    CONF_DOOR_POSITION,
+    CONF_OBSTRUCTION,
+    DEFAULT_TRAVEL_TIME,
+    DOOR_STATE_OPEN,
+    DOOR_STATE_CLOSED,
+    DOOR_STATE_OPENING,
+    DOOR_STATE_CLOSING,
+    DOOR_STATE_STOPPED,
+)
+from .entity import HomeKitDeviceEntity
+from .models import HomeKitDeviceContext
+
+# How often the interpolated position is published while the door moves
+POSITION_INTERVAL = timedelta(seconds=1)
+
+OPENING = "opening"
+CLOSING = "closing"
+
+class HomeKitDeviceGarageDoor(HomeKitDeviceEntity, CoverEntity):
+    """Representation of a HomeKit Device garage door.
+
+    Many openers only report the ends of travel. The proxy learns how
+    long each direction takes from the transitions it sees, and while the
+    door moves it interpolates the position from a single timer. An
+    obstruction stops the interpolation until the source reports again.
+    """
+
+    __slots__ = (
+        "_obstruction_entity",
+        "_obstructed",
+        "_travel_time",
+        "_position",
+        "_direction",
+        "_motion_start",
+        "_motion_start_position",
+        "_motion_interrupted",
+        "_target_state",
+        "_cancel_interval",
+    )
+
+    _attr_device_class = CoverDeviceClass.GARAGE
+    _attr_supported_features = (
+        CoverEntityFeature.OPEN | CoverEntityFeature.CLOSE | CoverEntityFeature.STOP
+    )
+
+    def __init__(
+        self,
+        context: HomeKitDeviceContext,
+        name: str,
+        entity_id: str,
+        obstruction_entity: str | None = None,
+    ) -> None:
+        """Initialize the garage door."""
+        super().__init__(context, name, entity_id)
+        self._obstruction_entity = obstruction_entity
+        self._obstructed = False
+        self._travel_time = {OPENING: DEFAULT_TRAVEL_TIME, CLOSING: DEFAULT_TRAVEL_TIME}
+        self._position: float | None = None
+        self._direction: str | None = None
+        self._motion_start: datetime | None = None
+        self._motion_start_position = 0.0
+        self._motion_interrupted = False
+        self._target_state = DOOR_STATE_CLOSED
+        self._cancel_interval = None
+
+    @property
+    def current_cover_position(self) -> int | None:
+        """Return the current position of the door."""
+        return None if self._position is None else round(self._position)
+
+    @property
+    def is_closed(self) -> bool | None:
+        """Return if the door is closed."""
+        return None if self._position is None else self._position <= 0
+
+    @property
+    def is_opening(self) -> bool:
+        """Return if the door is opening."""
+        return self._direction == OPENING and not self._obstructed
+
+    @property
+    def is_closing(self) -> bool:
+        """Return if the door is closing."""
+        return self._direction == CLOSING and not self._obstructed
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return the HomeKit door states and learned travel times."""
+        if self._obstructed:
+            current = DOOR_STATE_STOPPED
+        elif self._direction == OPENING:
+            current = DOOR_STATE_OPENING
+        elif self._direction == CLOSING:
+            current = DOOR_STATE_CLOSING
+        elif self._position is not None and self._position <= 0:
+            current = DOOR_STATE_CLOSED
+        elif self._position is not None and self._position >= 100:
+            current = DOOR_STATE_OPEN
+        else:
+            current = DOOR_STATE_STOPPED
+        return {
+            "current_door_state": current,
+            "target_door_state": self._target_state,
+            "obstruction_detected": self._obstructed,
+            "opening_time": round(self._travel_time[OPENING], 1),
+            "closing_time": round(self._travel_time[CLOSING], 1),
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """Run when entity is added to hass."""
+        self.async_on_remove(self._async_stop_interval)
+        if self._obstruction_entity:
+            async def _update_from_obstruction(entity_id, old_state, new_state):
+                if new_state is None:
+                    return
+                self._async_set_obstructed(new_state.state == STATE_ON)
+
+            self.async_on_remove(
+                async_track_state_change(
+                    self.hass,
+                    self._obstruction_entity,
+                    _update_from_obstruction,
+                )
+            )
+            if state := self.hass.states.get(self._obstruction_entity):
+                self._obstructed = state.state == STATE_ON
+        await super().async_added_to_hass()
+
+    async def async_open_cover(self, **kwargs) -> None:
+        """Open the door."""
+        self._target_state = DOOR_STATE_OPEN
+        await self.hass.services.async_call(
+            "cover", "open_cover", {"entity_id": self._source_entity}
+        )
+
+    async def async_close_cover(self, **kwargs) -> None:
+        """Close the door."""
+        self._target_state = DOOR_STATE_CLOSED
+        await self.hass.services.async_call(
+            "cover", "close_cover", {"entity_id": self._source_entity}
+        )
+
+    async def async_stop_cover(self, **kwargs) -> None:
+        """Stop the door."""
+        await self.hass.services.async_call(
+            "cover", "stop_cover", {"entity_id": self._source_entity}
+        )
+
+    @callback
+    def async_apply_source(self, state: State) -> bool:
+        """Apply the source entity state."""
+        now = dt_util.utcnow()
+        source_state = self._transform(state.state)
+        reported = state.attributes.get("current_position")
+
+        if source_state in (OPENING, CLOSING):
+            if self._direction != source_state:
+                self._async_start_motion(source_state, now, reported)
+            elif reported is not None:
+                # Openers that do report mid-travel positions re-anchor the estimate
+                self._motion_start = now
+                self._motion_start_position = float(reported)
+                self._position = float(reported)
+        else:
+            if source_state == "open":
+                end_position = 100.0 if reported is None else float(reported)
+                self._async_learn(OPENING, now, end_position)
+                self._target_state = DOOR_STATE_OPEN
+            elif source_state == "closed":
+                end_position = 0.0 if reported is None else float(reported)
+                self._async_learn(CLOSING, now, end_position)
+                self._target_state = DOOR_STATE_CLOSED
+            else:
+                end_position = (
+                    self._position if reported is None else float(reported)
+                )
+            self._async_stop_motion()
+            self._position = end_position
+
+        return True
+
+    @callback
+    def _async_start_motion(
+        self, direction: str, now: datetime, reported: float | None
+    ) -> None:
+        """Start interpolating the position in a direction."""
+        if reported is not None:
+            self._position = float(reported)
+        elif self._position is None:
+            self._position = 0.0 if direction == OPENING else 100.0
+        self._direction = direction
+        self._motion_start = now
+        self._motion_start_position = self._position
+        self._motion_interrupted = False
+        self._target_state = (
+            DOOR_STATE_OPEN if direction == OPENING else DOOR_STATE_CLOSED
+        )
+        if self._cancel_interval is None and not self._obstructed:
+            self._cancel_interval = async_track_time_interval(
+                self.hass, self._async_interpolate, POSITION_INTERVAL
+            )
+
+    @callback
+    def _async_learn(self, direction: str, now: datetime, end_position: float) -> None:
+        """Learn the travel time from a completed transition."""
+        if (
+            self._direction != direction
+            or self._motion_start is None
+            or self._motion_interrupted
+        ):
+            return
+        distance = abs(end_position - self._motion_start_position)
+        if distance < 50:
+            # Short partial moves say little about the full travel time
+            return
+        elapsed = (now - self._motion_start).total_seconds()
+        measured = elapsed * 100 / distance
+        # Smooth so one slow or interrupted run does not skew the estimate
+        self._travel_time[direction] = (self._travel_time[direction] + measured) / 2
+
+    @callback
+    def _async_stop_motion(self) -> None:
+        """Stop interpolating."""
+        self._async_stop_interval()
+        self._direction = None
+        self._motion_start = None
+
+    @callback
+    def _async_stop_interval(self) -> None:
+        """Cancel the interpolation timer."""
+        if self._cancel_interval is not None:
+            self._cancel_interval()
+            self._cancel_interval = None
+
+    @callback
+    def _async_interpolate(self, now: datetime) -> None:
+        """Publish the interpolated position."""
+        if self._direction is None or self._motion_start is None:
+            self._async_stop_interval()
+            return
+        elapsed = (now - self._motion_start).total_seconds()
+        travelled = elapsed * 100 / self._travel_time[self._direction]
+        if self._direction == OPENING:
+            position = self._motion_start_position + travelled
+        else:
+            position = self._motion_start_position - travelled
+        # Only the source may report the door fully open or closed
+        position = min(99.0, max(1.0, position))
+        if round(position) == round(self._position):
+            return
+        self._position = position
+        self._context.scheduler.async_write(self)
+
+    @callback
+    def _async_set_obstructed(self, obstructed: bool) -> None:
+        """Freeze or resume interpolation when the obstruction changes."""
+        if obstructed == self._obstructed:
+            return
+        self._obstructed = obstructed
+        if obstructed:
+            self._async_stop_interval()
+            self._motion_interrupted = self._direction is not None
+        elif self._direction is not None:
+            # Resume from where the door was frozen
+            self._motion_start = dt_util.utcnow()
+            self._motion_start_position = self._position
+            self._cancel_interval = async_track_time_interval(
+                self.hass, self._async_interpolate, POSITION_INTERVAL
+            )
+        self._context.scheduler.async_write(self)
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the HomeKit Device covers."""
+    context: HomeKitDeviceContext = hass.data[DOMAIN][config_entry.entry_id]
+    device_type = context.device_type
+    base_name = config_entry.data.get(CONF_NAME, "Smart Device")
+    entities = []
+
+    # Device-specific covers
+    if device_type == "garage_door":
+        if door := config_entry.data.get(CONF_DOOR_POSITION):
+            entities.append(
+                HomeKitDeviceGarageDoor(
+                    context,
+                    f"{base_name} Door",
+                    door,
+                    config_entry.data.get(CONF_OBSTRUCTION),
+                )
+            )
+
+    if entities:
+        async_add_entities(entities)
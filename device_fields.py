@@ -0,0 +1,100 @@
+"""Source entity fields of each device type."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Final
+
+from .const import (
+    CONF_POWER_SWITCH,
+    CONF_TEMP_SENSORS,
+    CONF_TARGET_TEMP,
+    CONF_CURRENT_TEMP,
+    CONF_STATUS_SENSOR,
+    CONF_COUNTDOWN,
+    CONF_FAULT,
+    CONF_KEEP_WARM,
+    CONF_SPEED_CONTROL,
+    CONF_OSCILLATION,
+    CONF_DIRECTION,
+    CONF_BRIGHTNESS,
+    CONF_COLOR_TEMP,
+    CONF_RGB_CONTROL,
+    CONF_CURRENT_HUMIDITY,
+    CONF_TARGET_HUMIDITY,
+    CONF_WATER_LEVEL,
+    CONF_AIR_QUALITY,
+    CONF_FILTER_LIFE,
+    CONF_PM25,
+    CONF_VOC,
+    CONF_DOOR_POSITION,
+    CONF_OBSTRUCTION,
+    CONF_MOTION,
+    CONF_LIGHT_SWITCH,
+    CONF_ALARM_STATE,
+    CONF_SENSORS,
+    CONF_SIREN,
+)
+
+@dataclass(frozen=True, slots=True)
+class SourceField:
+    """A source entity a device type can map."""
+
+    domain: str
+    required: bool = False
+    multiple: bool = False
+
+BASE_FIELDS: Final = {
+    CONF_POWER_SWITCH: SourceField("switch", required=True),
+    CONF_STATUS_SENSOR: SourceField("sensor"),
+}
+
+DEVICE_FIELDS: Final = {
+    "kettle": {
+        CONF_CURRENT_TEMP: SourceField("sensor"),
+        CONF_TARGET_TEMP: SourceField("input_number"),
+        CONF_COUNTDOWN: SourceField("sensor"),
+        CONF_FAULT: SourceField("sensor"),
+        CONF_KEEP_WARM: SourceField("switch"),
+    },
+    "thermostat": {
+        CONF_CURRENT_TEMP: SourceField("sensor", required=True),
+        CONF_TARGET_TEMP: SourceField("number", required=True),
+        CONF_TEMP_SENSORS: SourceField("sensor", multiple=True),
+    },
+    "fan": {
+        CONF_SPEED_CONTROL: SourceField("number"),
+        CONF_OSCILLATION: SourceField("switch"),
+        CONF_DIRECTION: SourceField("select"),
+    },
+    "light": {
+        CONF_BRIGHTNESS: SourceField("number"),
+        CONF_COLOR_TEMP: SourceField("number"),
+        CONF_RGB_CONTROL: SourceField("text"),
+    },
+    "humidifier": {
+        CONF_CURRENT_HUMIDITY: SourceField("sensor", required=True),
+        CONF_TARGET_HUMIDITY: SourceField("number", required=True),
+        CONF_WATER_LEVEL: SourceField("sensor"),
+    },
+    "air_purifier": {
+        CONF_AIR_QUALITY: SourceField("sensor", required=True),
+        CONF_FILTER_LIFE: SourceField("sensor"),
+        CONF_PM25: SourceField("sensor"),
+        CONF_VOC: SourceField("sensor"),
+    },
+    "garage_door": {
+        CONF_DOOR_POSITION: SourceField("cover", required=True),
+        CONF_OBSTRUCTION: SourceField("binary_sensor"),
+        CONF_MOTION: SourceField("binary_sensor"),
+        CONF_LIGHT_SWITCH: SourceField("light"),
+    },
+    "security_system": {
+        CONF_ALARM_STATE: SourceField("alarm_control_panel", required=True),
+        CONF_SENSORS: SourceField("binary_sensor", multiple=True),
+        CONF_SIREN: SourceField("switch"),
+    },
+}
+
+def get_device_fields(device_type: str) -> dict[str, SourceField]:
+    """Return the source fields of a device type, keyed by mapping key."""
+    return {**BASE_FIELDS, **DEVICE_FIELDS.get(device_type, {})}
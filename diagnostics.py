@@ -0,0 +1,22 @@
+"""Diagnostics support for HomeKit Device Aggregator."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .models import HomeKitDeviceContext
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    context: HomeKitDeviceContext = hass.data[DOMAIN][entry.entry_id]
+    return {
+        "device_type": context.device_type,
+        "hydration_time": context.hydrator.hydration_time,
+        "health": context.health.as_dict(),
+        "updates": context.scheduler.as_dict(),
+    }
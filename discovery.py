@@ -0,0 +1,386 @@
+"""Discovery of aggregation candidates for HomeKit Device Aggregator."""
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+import logging
+import re
+import time
+from typing import Any, Final
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import (
+    area_registry as ar,
+    device_registry as dr,
+    entity_registry as er,
+)
+
+from .const import (
+    DOMAIN,
+    CONF_POWER_SWITCH,
+    CONF_STATUS_SENSOR,
+    CONF_CURRENT_TEMP,
+    CONF_TARGET_TEMP,
+    CONF_COUNTDOWN,
+    CONF_FAULT,
+    CONF_KEEP_WARM,
+    CONF_TEMP_SENSORS,
+    CONF_SPEED_CONTROL,
+    CONF_OSCILLATION,
+    CONF_DIRECTION,
+    CONF_BRIGHTNESS,
+    CONF_COLOR_TEMP,
+    CONF_RGB_CONTROL,
+    CONF_CURRENT_HUMIDITY,
+    CONF_TARGET_HUMIDITY,
+    CONF_WATER_LEVEL,
+    CONF_AIR_QUALITY,
+    CONF_FILTER_LIFE,
+    CONF_PM25,
+    CONF_VOC,
+    CONF_DOOR_POSITION,
+    CONF_OBSTRUCTION,
+    CONF_MOTION,
+    CONF_LIGHT_SWITCH,
+    CONF_ALARM_STATE,
+    CONF_SENSORS,
+    CONF_SIREN,
+)
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+MAX_CANDIDATES: Final = 20
+# Name tokens shared by more entities than this are too generic to seed a group
+MAX_TOKEN_GROUP: Final = 12
+
+_TOKEN: Final = re.compile(r"[a-z0-9]+")
+
+# Name tokens and device classes that suggest an entity fills a given mapping
+KEY_HINTS: Final = {
+    CONF_POWER_SWITCH: ({"power", "plug", "outlet", "main"}, {"outlet", "switch"}),
+    CONF_STATUS_SENSOR: ({"status", "state", "mode"}, set()),
+    CONF_CURRENT_TEMP: ({"temperature", "temp", "current", "water"}, {"temperature"}),
+    CONF_TARGET_TEMP: ({"target", "setpoint", "set"}, {"temperature"}),
+    CONF_COUNTDOWN: ({"countdown", "timer", "remaining"}, {"duration"}),
+    CONF_FAULT: ({"fault", "error"}, {"problem"}),
+    CONF_KEEP_WARM: ({"keep", "warm"}, set()),
+    CONF_TEMP_SENSORS: ({"temperature", "temp"}, {"temperature"}),
+    CONF_SPEED_CONTROL: ({"speed", "fan"}, set()),
+    CONF_OSCILLATION: ({"oscillation", "oscillate", "swing"}, set()),
+    CONF_DIRECTION: ({"direction", "reverse"}, set()),
+    CONF_BRIGHTNESS: ({"brightness", "dimmer", "level"}, set()),
+    CONF_COLOR_TEMP: ({"colour", "color", "kelvin", "white"}, set()),
+    CONF_RGB_CONTROL: ({"rgb", "colour", "color", "hue"}, set()),
+    CONF_CURRENT_HUMIDITY: ({"humidity", "current"}, {"humidity"}),
+    CONF_TARGET_HUMIDITY: ({"target", "humidity"}, {"humidity"}),
+    CONF_WATER_LEVEL: ({"water", "level", "tank"}, set()),
+    CONF_AIR_QUALITY: ({"air", "quality", "aqi"}, {"aqi"}),
+    CONF_FILTER_LIFE: ({"filter", "life"}, set()),
+    CONF_PM25: ({"pm25", "pm2", "particulate"}, {"pm25"}),
+    CONF_VOC: ({"voc", "tvoc", "organic"}, {
+        "volatile_organic_compounds",
+        "volatile_organic_compounds_parts",
+    }),
+    CONF_DOOR_POSITION: ({"door", "garage", "position"}, {"garage", "door"}),
+    CONF_OBSTRUCTION: ({"obstruction", "obstacle", "blocked"}, {"problem", "safety"}),
+    CONF_MOTION: ({"motion", "occupancy", "presence"}, {"motion", "occupancy"}),
+    CONF_LIGHT_SWITCH: ({"light", "lamp"}, set()),
+    CONF_ALARM_STATE: ({"alarm", "security"}, set()),
+    CONF_SENSORS: ({"door", "window", "contact", "motion"}, {
+        "door",
+        "window",
+        "opening",
+        "motion",
+    }),
+    CONF_SIREN: ({"siren", "bell"}, set()),
+}
+
+# Name tokens that suggest a group of entities is a given device type
+DEVICE_TYPE_HINTS: Final = {
+    "kettle": {"kettle"},
+    "thermostat": {"thermostat", "heating", "climate"},
+    "fan": {"fan"},
+    "light": {"light", "lamp"},
+    "humidifier": {"humidifier"},
+    "air_purifier": {"purifier", "air"},
+    "garage_door": {"garage"},
+    "security_system": {"alarm", "security"},
+}
+
+@dataclass(frozen=True)
+class DiscoveryCandidate:
+    """A suggested aggregated device."""
+
+    device_type: str
+    name: str
+    score: int
+    mapping: dict[str, Any]
+
+    @property
+    def entity_count(self) -> int:
+        """Return the number of entities mapped by the candidate."""
+        return sum(
+            len(value) if isinstance(value, list) else 1
+            for value in self.mapping.values()
+        )
+
+@dataclass(frozen=True)
+class _Slot:
+    """A mapping key a device type accepts, derived from its schema."""
+
+    key: str
+    required: bool
+    domains: frozenset[str]
+    multiple: bool
+    tokens: frozenset[str]
+    device_classes: frozenset[str]
+
+@dataclass(frozen=True)
+class _Indexed:
+    """An entity registry entry reduced to what matching needs."""
+
+    entity_id: str
+    domain: str
+    tokens: frozenset[str]
+    device_class: str | None
+
+def _tokenize(*names: str | None) -> set[str]:
+    """Split names into lower-case word tokens."""
+    return set(_TOKEN.findall(" ".join(filter(None, names)).lower()))
+
+def _build_slots(schemas: dict[str, dict]) -> dict[str, list[_Slot]]:
+    """Turn config flow schemas into matchable slots, required keys first."""
+    slots: dict[str, list[_Slot]] = {}
+    for device_type, schema in schemas.items():
+        device_slots = []
+        for marker, field_selector in schema.items():
+            key = str(marker.schema)
+            config = getattr(field_selector, "config", {})
+            domains = config.get("domain") or []
+            if isinstance(domains, str):
+                domains = [domains]
+            hint_tokens, hint_classes = KEY_HINTS.get(key, (set(), set()))
+            device_slots.append(
+                _Slot(
+                    key=key,
+                    required=isinstance(marker, vol.Required),
+                    domains=frozenset(domains),
+                    multiple=bool(config.get("multiple", False)),
+                    tokens=frozenset(hint_tokens),
+                    device_classes=frozenset(hint_classes),
+                )
+            )
+        device_slots.sort(key=lambda slot: not slot.required)
+        slots[device_type] = device_slots
+    return slots
+
+def _slot_score(slot: _Slot, entity: _Indexed) -> int:
+    """Score how well an entity of one of a slot's domains fits the slot."""
+    score = 2 * len(slot.tokens & entity.tokens)
+    if entity.device_class in slot.device_classes:
+        score += 3
+    return score
+
+def _match_group(
+    device_type: str,
+    slots: list[_Slot],
+    members: list[_Indexed],
+    group_tokens: set[str],
+    by_domains: dict[frozenset[str], list[_Indexed]],
+) -> tuple[int, dict[str, Any]] | None:
+    """Greedily assign group members to a device type's slots.
+
+    by_domains caches the members of each set of slot domains, and is
+    shared by all the device types matched against the group.
+    """
+    used: set[str] = set()
+    mapping: dict[str, Any] = {}
+    score = 0
+
+    for slot in slots:
+        if not slot.domains:
+            fitting = members
+        elif (fitting := by_domains.get(slot.domains)) is None:
+            fitting = by_domains[slot.domains] = [
+                entity for entity in members if entity.domain in slot.domains
+            ]
+        if slot.multiple:
+            matches = [
+                entity.entity_id
+                for entity in fitting
+                if entity.entity_id not in used and _slot_score(slot, entity) > 0
+            ]
+            if matches:
+                mapping[slot.key] = matches
+                used.update(matches)
+                score += 2 * len(matches)
+            elif slot.required:
+                return None
+            continue
+
+        best: _Indexed | None = None
+        # Required slots take any entity of the right domain, optional
+        # ones need at least one hint to match
+        best_score = -1 if slot.required else 0
+        for entity in fitting:
+            if entity.entity_id in used:
+                continue
+            entity_score = _slot_score(slot, entity)
+            if entity_score > best_score:
+                best = entity
+                best_score = entity_score
+        if best is None:
+            if slot.required:
+                return None
+            continue
+        mapping[slot.key] = best.entity_id
+        used.add(best.entity_id)
+        score += 2 + best_score
+
+    if len(used) < 2:
+        return None
+    if DEVICE_TYPE_HINTS.get(device_type, set()) & group_tokens:
+        score += 5
+    return score, mapping
+
+@callback
+def async_discover_candidates(
+    hass: HomeAssistant, schemas: dict[str, dict]
+) -> list[DiscoveryCandidate]:
+    """Suggest aggregated devices from the entity and device registries.
+
+    The registries are scanned once into inverted indexes keyed by device,
+    and by area plus name token; groups drawn from those indexes are then
+    matched against the schema of each device type and ranked.
+    """
+    start = time.perf_counter()
+    entity_registry = er.async_get(hass)
+    device_registry = dr.async_get(hass)
+    slots = _build_slots(schemas)
+    required_domains = {
+        device_type: {
+            domain
+            for slot in device_slots
+            if slot.required and len(slot.domains) == 1
+            for domain in slot.domains
+        }
+        for device_type, device_slots in slots.items()
+    }
+
+    configured: set[str] = set()
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        for value in entry.data.values():
+            if isinstance(value, str):
+                configured.add(value)
+            elif isinstance(value, list):
+                configured.update(value)
+
+    indexed: list[_Indexed] = []
+    group_tokens: list[set[str]] = []
+    by_device: dict[str, list[int]] = defaultdict(list)
+    by_area_token: dict[tuple[str | None, str], list[int]] = defaultdict(list)
+    # Devices have several entities, so their area and name are read once
+    device_details: dict[str | None, tuple[str | None, set[str]]] = {
+        None: (None, set())
+    }
+
+    for entry in entity_registry.entities.values():
+        if (
+            entry.disabled_by is not None
+            or entry.platform == DOMAIN
+            or entry.entity_id in configured
+        ):
+            continue
+        if (details := device_details.get(entry.device_id)) is None:
+            device = device_registry.devices.get(entry.device_id)
+            details = device_details[entry.device_id] = (
+                (device.area_id, _tokenize(device.name_by_user or device.name))
+                if device
+                else (None, set())
+            )
+        device_area_id, device_tokens = details
+        area_id = entry.area_id or device_area_id
+        tokens = _tokenize(
+            entry.name or entry.original_name, entry.entity_id.partition(".")[2]
+        )
+        all_tokens = tokens | device_tokens
+        index = len(indexed)
+        indexed.append(
+            _Indexed(
+                entity_id=entry.entity_id,
+                domain=entry.domain,
+                tokens=frozenset(tokens),
+                device_class=entry.device_class or entry.original_device_class,
+            )
+        )
+        group_tokens.append(all_tokens)
+        if entry.device_id:
+            by_device[entry.device_id].append(index)
+        for token in all_tokens:
+            # Numbers tell devices apart rather than grouping them
+            if not token.isdigit():
+                by_area_token[(area_id, token)].append(index)
+
+    groups: dict[frozenset[int], str] = {}
+    for device_id, members in by_device.items():
+        if len(members) > 1:
+            device = device_registry.devices[device_id]
+            groups.setdefault(
+                frozenset(members), device.name_by_user or device.name or device_id
+            )
+
+    area_registry = ar.async_get(hass)
+    for (area_id, token), members in by_area_token.items():
+        if not 1 < len(members) <= MAX_TOKEN_GROUP:
+            continue
+        key = frozenset(members)
+        if key in groups:
+            continue
+        area = area_registry.async_get_area(area_id) if area_id else None
+        groups[key] = f"{area.name} {token.title()}" if area else token.title()
+
+    candidates: list[DiscoveryCandidate] = []
+    for members_key, name in groups.items():
+        members = [indexed[index] for index in sorted(members_key)]
+        domains = {entity.domain for entity in members}
+        tokens = set().union(*(group_tokens[index] for index in members_key))
+        best: DiscoveryCandidate | None = None
+        by_domains: dict[frozenset[str], list[_Indexed]] = {}
+        for device_type, device_slots in slots.items():
+            if not required_domains[device_type] <= domains:
+                continue
+            match = _match_group(device_type, device_slots, members, tokens, by_domains)
+            if match is None:
+                continue
+            score, mapping = match
+            if best is None or score > best.score:
+                best = DiscoveryCandidate(device_type, name, score, mapping)
+        if best is not None:
+            candidates.append(best)
+
+    candidates.sort(key=lambda c: (c.score, c.entity_count), reverse=True)
+
+    # Drop lower ranked suggestions that reuse entities of a better one
+    claimed: set[str] = set()
+    results: list[DiscoveryCandidate] = []
+    for candidate in candidates:
+        entity_ids = set()
+        for value in candidate.mapping.values():
+            entity_ids.update(value if isinstance(value, list) else [value])
+        if entity_ids & claimed:
+            continue
+        claimed |= entity_ids
+        results.append(candidate)
+        if len(results) >= MAX_CANDIDATES:
+            break
+
+    _LOGGER.debug(
+        "Scanned %d entities into %d groups and %d candidates in %.1f ms",
+        len(indexed),
+        len(groups),
+        len(results),
+        (time.perf_counter() - start) * 1000,
+    )
+    return results
@@ -1,153 +1,175 @@
-"""Platform entities for HomeKit Device Aggregator."""
+"""Base entity for HomeKit Device Aggregator."""
 from __future__ import annotations
 
-from homeassistant.components.switch import SwitchEntity
-from homeassistant.components.sensor import SensorEntity
-from homeassistant.components.select import SelectEntity
-from homeassistant.const import (
-    ATTR_NAME,
-    STATE_ON,
-    STATE_OFF,
-    UnitOfTemperature,
-)
-from homeassistant.core import HomeAssistant
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+from homeassistant.const import STATE_ON
+from homeassistant.core import State, callback
 from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.helpers.event import async_track_state_change
 
-from .const import DOMAIN, CONF_NAME, CONF_DEVICE_TYPE
-from .homekit_type import (
-    CHAR_CURRENT_TEMPERATURE,
-    CHAR_TARGET_TEMPERATURE,
-    CHAR_HEATING_COOLING_CURRENT,
-)
+from .models import HomeKitDeviceContext
+from .scheduler import UpdatePriority
+from .transforms import Transform, identity
+
+class HomeKitDeviceBaseEntity:
+    """An entity of an aggregated device, identified through its entry's context."""
+
+    __slots__ = ("_context",)
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    # Proxies of state a user acts on are published ahead of telemetry
+    update_priority = UpdatePriority.CONTROL
+
+    def __init__(self, context: HomeKitDeviceContext, name: str, key: str) -> None:
+        """Initialize the entity with a unique id from the device and key."""
+        self.hass = context.hass
+        self._context = context
+        self._attr_unique_id = f"{context.identifier}_{key}"
+        self._attr_name = name
 
-class HomeKitDeviceEntity:
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return the device info shared by every entity of the device."""
+        return self._context.device_info
+
+class HomeKitDeviceEntity(HomeKitDeviceBaseEntity):
     """Representation of a HomeKit Device entity."""
 
-    def __init__(self, hass: HomeAssistant, entry_id: str, name: str, entity_id: str) -> None:
+    __slots__ = ("_source_entity", "_transform")
+
+    def __init__(self, context: HomeKitDeviceContext, name: str, entity_id: str) -> None:
         """Initialize the entity."""
-        self.hass = hass
-        self._entry_id = entry_id
-        self._name = name
+        super().__init__(context, name, entity_id)
         self._source_entity = entity_id
-        self._attr_unique_id = f"{DOMAIN}_{entry_id}_{entity_id}"
-        self._attr_name = name
-        self._attr_has_entity_name = True
-        self.device_type = self.hass.data[DOMAIN][entry_id]["device_type"]
-        device_name = self.hass.data[DOMAIN][entry_id]["config"][CONF_NAME]
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"{DOMAIN}_{entry_id}")},
-            name=device_name,
-            manufacturer="HomeKit Device Aggregator",
-            model=self.device_type.title(),
-            suggested_area="Kitchen" if self.device_type == "kettle" else None,
-            via_device=(DOMAIN, f"{DOMAIN}_{entry_id}"),
-        )
-        self._attr_should_poll = False
+        self._transform = context.transforms.get(entity_id) or self._default_transform()
+
+    @property
+    def available(self) -> bool:
+        """Return if the source and every required source of the device are available."""
+        return self._context.health.proxy_available(self._source_entity)
+
+    def _default_transform(self) -> Transform:
+        """Return the transform used when none is configured for the mapping."""
+        return identity
+
+    def _secondary_sources(self) -> tuple[str, ...]:
+        """Return the sources other than the primary one the proxy combines."""
+        return ()
 
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to register update signal handler."""
-        async def _update_from_source(entity_id, old_state, new_state):
-            if new_state is None:
+        hydrator = self._context.hydrator
+        scheduler = self._context.scheduler
+        health = self._context.health
+        primary = self._source_entity
+        secondary = self._secondary_sources()
+
+        @callback
+        def _update_from_source(entity_id, old_state, new_state):
+            # Pending proxies are written by the batched hydration instead
+            if new_state is None or (entity_id == primary and hydrator.is_pending(self)):
                 return
-            await self.async_update_from_source(new_state)
+            scheduler.async_schedule(self, new_state)
 
         self.async_on_remove(
             async_track_state_change(
                 self.hass,
-                self._source_entity,
+                [primary, *secondary],
                 _update_from_source
             )
         )
-
-        # Set initial state
-        if state := self.hass.states.get(self._source_entity):
-            await self.async_update_from_source(state)
-
-    async def async_update_from_source(self, state) -> None:
-        """Update the entity from the source entity state."""
-        raise NotImplementedError
-
-class HomeKitDeviceSwitch(HomeKitDeviceEntity, SwitchEntity):
-    """Representation of a HomeKit Device switch."""
-
-    _attr_device_class = "switch"
-
-    async def async_turn_on(self, **kwargs) -> None:
-        """Turn the entity on."""
-        await self.hass.services.async_call(
-            "switch", "turn_on", {"entity_id": self._source_entity}
-        )
-
-    async def async_turn_off(self, **kwargs) -> None:
-        """Turn the entity off."""
-        await self.hass.services.async_call(
-            "switch", "turn_off", {"entity_id": self._source_entity}
-        )
-
-    async def async_update_from_source(self, state) -> None:
+        self.async_on_remove(partial(hydrator.async_unregister, self))
+        self.async_on_remove(partial(scheduler.async_cancel, self))
+        for source in (primary, *secondary):
+            self.async_on_remove(health.async_add_proxy(self, source))
+
+        # Set initial state, written by Home Assistant once the entity is added
+        if state := hydrator.async_register(self, primary):
+            self.async_apply_source(state)
+        for source in secondary:
+            if state := self.hass.states.get(source):
+                self.async_apply_source(state)
+
+    @callback
+    def async_update_from_source(self, state: State) -> None:
         """Update the entity from the source entity state."""
-        self._attr_is_on = state.state == STATE_ON
-        self.async_write_ha_state()
-
-class HomeKitDeviceSensor(HomeKitDeviceEntity, SensorEntity):
-    """Representation of a HomeKit Device sensor."""
+        if self.async_apply_source(state):
+            self._context.scheduler.async_write(self)
 
-    def __init__(self, hass: HomeAssistant, entry_id: str, name: str, entity_id: str, unit: str | None = None) -> None:
-        """Initialize the sensor."""
-        super().__init__(hass, entry_id, name, entity_id)
-        self._attr_native_unit_of_measurement = unit
-        self._attr_device_class = "temperature" if unit == UnitOfTemperature.CELSIUS else None
+    @callback
+    def async_apply_source(self, state: State) -> bool:
+        """Apply a source state without writing, returning if a write is needed."""
+        raise NotImplementedError
 
-        # Set HomeKit characteristics for temperature sensors
-        if self._attr_device_class == "temperature":
-            self._attr_entity_category = None
-            self._attr_translation_key = "temperature"
-            self._attr_homekit_char = CHAR_CURRENT_TEMPERATURE
+class HomeKitDeviceCompositeEntity(HomeKitDeviceEntity):
+    """Representation of a HomeKit Device entity combining several sources.
 
-    async def async_update_from_source(self, state) -> None:
-        """Update the entity from the source entity state."""
-        self._attr_native_value = state.state
-        self.async_write_ha_state()
+    Each source has a handler applying its transformed value to the
+    entity. The values the entity publishes form a snapshot, and a source
+    update only leads to a write when it changes the snapshot.
+    """
 
-class HomeKitDeviceSelect(HomeKitDeviceEntity, SelectEntity):
-    """Representation of a HomeKit Device select."""
+    __slots__ = ("_handlers", "_sources", "_snapshot")
 
-    _attr_has_entity_name = True
+    def __init__(self, context: HomeKitDeviceContext, name: str, entity_id: str) -> None:
+        """Initialize the entity."""
+        super().__init__(context, name, entity_id)
+        self._handlers: dict[str, tuple[Callable[..., None], Transform]] = {}
+        self._sources: dict[str, State] = {}
+        self._snapshot: tuple | None = None
 
-    def __init__(
+    def _add_source(
         self,
-        hass: HomeAssistant,
-        entry_id: str,
-        name: str,
         entity_id: str,
-        options: list[str],
+        apply: Callable[[State, Any], None],
+        default: Transform = identity,
     ) -> None:
-        """Initialize the select."""
-        super().__init__(hass, entry_id, name, entity_id)
-        self._attr_options = options
-
-        # Set HomeKit characteristics for keep warm functionality
-        if "Keep Warm" in name and self.device_type == "kettle":
-            self._attr_entity_category = None
-            self._attr_translation_key = "keep_warm"
-            self._attr_homekit_char = CHAR_HEATING_COOLING_CURRENT
-            self._attr_icon = "mdi:kettle-steam"
-
-    async def async_select_option(self, option: str) -> None:
-        """Update the current value."""
-        await self.hass.services.async_call(
-            "select", "select_option",
-            {"entity_id": self._source_entity, "option": option}
-        )
-
-    async def async_update_from_source(self, state) -> None:
-        """Update the entity from the source entity state."""
-        if "Keep Warm" in self._name and self.device_type == "kettle":
-            # Convert keep warm state to HomeKit format
-            self._attr_current_option = "On" if state.state != "Off" else "Off"
+        """Apply a source's transformed values with a handler."""
+        transform = self._context.transforms.get(entity_id) or default
+        if getattr(apply, "__self__", None) is self:
+            # Keep the plain function rather than the bound method, so the handlers
+            # hold no reference back to the entity and it is freed once removed
+            handler = apply.__func__
         else:
-            self._attr_current_option = state.state
-        self.async_write_ha_state()
+            def handler(entity: HomeKitDeviceCompositeEntity, state: State, value: Any) -> None:
+                apply(state, value)
+        self._handlers[entity_id] = (handler, transform)
+
+    def _secondary_sources(self) -> tuple[str, ...]:
+        """Return the sources other than the primary one."""
+        return tuple(source for source in self._handlers if source != self._source_entity)
+
+    def _source_value(self, entity_id: str) -> str | None:
+        """Return the last raw state seen from a source."""
+        state = self._sources.get(entity_id)
+        return None if state is None else state.state
+
+    async def _async_set_power(self, on: bool) -> None:
+        """Switch a primary power switch if it is not already in that state."""
+        if (self._source_value(self._source_entity) == STATE_ON) != on:
+            await self.hass.services.async_call(
+                "switch",
+                "turn_on" if on else "turn_off",
+                {"entity_id": self._source_entity},
+            )
+
+    def _build_snapshot(self) -> tuple:
+        """Return the values the entity publishes."""
+        raise NotImplementedError
+
+    @callback
+    def async_apply_source(self, state: State) -> bool:
+        """Apply the state of one of the sources."""
+        self._sources[state.entity_id] = state
+        apply, transform = self._handlers[state.entity_id]
+        apply(self, state, transform(state.state))
+        snapshot = self._build_snapshot()
+        if snapshot == self._snapshot:
+            return False
+        self._snapshot = snapshot
+        return True
@@ -0,0 +1,322 @@
+"""Platform for fan integration."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from homeassistant.components.fan import (
+    DIRECTION_FORWARD,
+    DIRECTION_REVERSE,
+    FanEntity,
+    FanEntityFeature,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import STATE_ON
+from homeassistant.core import HomeAssistant, State
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import (
+    DOMAIN,
+    CONF_NAME,
+    CONF_POWER_SWITCH,
+    CONF_SPEED_CONTROL,
+    CONF_OSCILLATION,
+    CONF_DIRECTION,
+    CONF_FILTER_LIFE,
+    FILTER_CHANGE_THRESHOLD,
+)
+from .entity import HomeKitDeviceCompositeEntity
+from .models import HomeKitDeviceContext
+from .transforms import to_float
+
+# Source direction options, matched case-insensitively, and the fan direction
+DIRECTION_FROM_SOURCE = {
+    "forward": DIRECTION_FORWARD,
+    "reverse": DIRECTION_REVERSE,
+}
+
+@dataclass(frozen=True, slots=True)
+class SpeedSteps:
+    """Lookup tables between a speed source's values and fan percentages."""
+
+    off: float | None
+    values: tuple[float, ...]
+    percentages: tuple[int, ...]
+    # Source value for every percentage from 0 to 100
+    pct_to_value: tuple[float | None, ...]
+    minimum: float
+    step: float
+
+    @property
+    def count(self) -> int:
+        """Return the number of speeds."""
+        return len(self.values)
+
+    def percentage(self, value: float) -> int:
+        """Return the percentage of the step nearest a source value."""
+        index = round((value - self.minimum) / self.step)
+        if self.off is not None:
+            index -= 1
+        if index < 0:
+            return 0
+        return self.percentages[min(index, self.count - 1)]
+
+@lru_cache(maxsize=32)
+def speed_steps(minimum: float, maximum: float, step: float) -> SpeedSteps:
+    """Build the speed tables for a number source's range and step."""
+    step = step or 1
+    count = int(round((maximum - minimum) / step)) + 1
+    values = [round(minimum + index * step, 6) for index in range(count)]
+    # A range starting at zero has an off position below the first speed
+    off = values.pop(0) if minimum <= 0 and len(values) > 1 else None
+    speeds = len(values)
+    percentages = tuple(round((index + 1) * 100 / speeds) for index in range(speeds))
+    # Each percentage picks the nearest speed, so a speed's own percentage maps back to it
+    pct_to_value = (off,) + tuple(
+        values[max(1, round(pct * speeds / 100)) - 1] for pct in range(1, 101)
+    )
+    return SpeedSteps(off, tuple(values), percentages, pct_to_value, minimum, step)
+
+class HomeKitDeviceFan(HomeKitDeviceCompositeEntity, FanEntity):
+    """Representation of a HomeKit Device fan.
+
+    Power, speed, oscillation and direction sources are combined into one
+    fan that is only written when what it publishes changes. Commands go
+    only to the sources whose state differs from what was asked for.
+    """
+
+    __slots__ = (
+        "_speed_entity",
+        "_oscillation_entity",
+        "_direction_entity",
+        "_steps",
+    )
+
+    def __init__(
+        self,
+        context: HomeKitDeviceContext,
+        name: str,
+        power: str,
+        speed: str | None = None,
+        oscillation: str | None = None,
+        direction: str | None = None,
+    ) -> None:
+        """Initialize the fan."""
+        super().__init__(context, name, power)
+        self._speed_entity = speed
+        self._oscillation_entity = oscillation
+        self._direction_entity = direction
+        self._steps: SpeedSteps | None = None
+
+        self._add_source(power, self._apply_power)
+        features = FanEntityFeature.TURN_ON | FanEntityFeature.TURN_OFF
+        if speed:
+            features |= FanEntityFeature.SET_SPEED
+            self._add_source(speed, self._apply_speed, to_float)
+        if oscillation:
+            features |= FanEntityFeature.OSCILLATE
+            self._add_source(oscillation, self._apply_oscillation)
+        if direction:
+            features |= FanEntityFeature.DIRECTION
+            self._add_source(direction, self._apply_direction)
+        self._attr_supported_features = features
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return if the power source is on, whatever the speed."""
+        return self._attr_is_on
+
+    @property
+    def speed_count(self) -> int:
+        """Return the number of speeds the source supports."""
+        return self._steps.count if self._steps else 100
+
+    def _apply_power(self, state: State, value: Any) -> None:
+        self._attr_is_on = value == STATE_ON
+
+    def _apply_speed(self, state: State, value: float | None) -> None:
+        attributes = state.attributes
+        self._steps = speed_steps(
+            attributes.get("min", 0), attributes.get("max", 100), attributes.get("step", 1)
+        )
+        self._attr_percentage = None if value is None else self._steps.percentage(value)
+
+    def _apply_oscillation(self, state: State, value: Any) -> None:
+        self._attr_oscillating = value == STATE_ON
+
+    def _apply_direction(self, state: State, value: Any) -> None:
+        self._attr_current_direction = DIRECTION_FROM_SOURCE.get(str(value).lower())
+
+    def _build_snapshot(self) -> tuple:
+        """Return the values the fan publishes."""
+        return (
+            self._attr_is_on,
+            self._attr_percentage,
+            self._attr_oscillating,
+            self._attr_current_direction,
+            self.speed_count,
+        )
+
+    async def async_turn_on(
+        self,
+        percentage: int | None = None,
+        preset_mode: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Turn the fan on."""
+        if percentage is not None:
+            # Setting the speed switches the power as well
+            await self.async_set_percentage(percentage)
+            return
+        await self._async_set_power(True)
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Turn the fan off."""
+        await self._async_set_power(False)
+
+    async def async_set_percentage(self, percentage: int) -> None:
+        """Set the speed, turning the fan on or off as needed."""
+        if percentage == 0:
+            await self._async_set_power(False)
+            return
+        await self._async_set_power(True)
+        if self._speed_entity is None or self._steps is None:
+            return
+        value = self._steps.pct_to_value[min(100, max(1, percentage))]
+        if to_float(self._source_value(self._speed_entity)) != value:
+            await self.hass.services.async_call(
+                "number",
+                "set_value",
+                {"entity_id": self._speed_entity, "value": value},
+            )
+
+    async def async_oscillate(self, oscillating: bool) -> None:
+        """Set oscillation."""
+        if self._oscillation_entity is None or oscillating == self._attr_oscillating:
+            return
+        await self.hass.services.async_call(
+            "switch",
+            "turn_on" if oscillating else "turn_off",
+            {"entity_id": self._oscillation_entity},
+        )
+
+    async def async_set_direction(self, direction: str) -> None:
+        """Set the direction."""
+        if self._direction_entity is None or direction == self._attr_current_direction:
+            return
+        state = self._sources.get(self._direction_entity)
+        options = state.attributes.get("options", []) if state else []
+        # Use the source's own spelling of the option
+        option = next(
+            (option for option in options if option.lower() == direction),
+            direction.title(),
+        )
+        await self.hass.services.async_call(
+            "select",
+            "select_option",
+            {"entity_id": self._direction_entity, "option": option},
+        )
+
+class HomeKitDeviceAirPurifier(HomeKitDeviceCompositeEntity, FanEntity):
+    """Representation of a HomeKit Device air purifier.
+
+    The power switch and filter life sources are combined into one
+    purifier. Filter life is published as HomeKit's FilterMaintenance
+    level and change indication.
+    """
+
+    __slots__ = ("_filter_life",)
+
+    _attr_supported_features = FanEntityFeature.TURN_ON | FanEntityFeature.TURN_OFF
+
+    def __init__(
+        self,
+        context: HomeKitDeviceContext,
+        name: str,
+        power: str,
+        filter_life: str | None = None,
+    ) -> None:
+        """Initialize the air purifier."""
+        super().__init__(context, name, power)
+        self._filter_life: float | None = None
+        self._add_source(power, self._apply_power)
+        if filter_life:
+            self._add_source(filter_life, self._apply_filter_life, to_float)
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return if the power source is on."""
+        return self._attr_is_on
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return the HomeKit filter maintenance values."""
+        if self._filter_life is None:
+            return {"filter_life_level": None, "filter_change_indication": None}
+        return {
+            "filter_life_level": self._filter_life,
+            "filter_change_indication": int(self._filter_life <= FILTER_CHANGE_THRESHOLD),
+        }
+
+    def _apply_power(self, state: State, value: Any) -> None:
+        self._attr_is_on = value == STATE_ON
+
+    def _apply_filter_life(self, state: State, value: float | None) -> None:
+        self._filter_life = None if value is None else min(100.0, max(0.0, value))
+
+    def _build_snapshot(self) -> tuple:
+        """Return the values the purifier publishes."""
+        return (self._attr_is_on, self._filter_life)
+
+    async def async_turn_on(
+        self,
+        percentage: int | None = None,
+        preset_mode: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Turn the purifier on."""
+        await self._async_set_power(True)
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Turn the purifier off."""
+        await self._async_set_power(False)
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the HomeKit Device fans."""
+    context: HomeKitDeviceContext = hass.data[DOMAIN][config_entry.entry_id]
+    device_type = context.device_type
+    base_name = config_entry.data.get(CONF_NAME, "Smart Device")
+    entities = []
+
+    # Device-specific fans
+    if device_type == "fan":
+        if power := config_entry.data.get(CONF_POWER_SWITCH):
+            entities.append(
+                HomeKitDeviceFan(
+                    context,
+                    f"{base_name} Fan",
+                    power,
+                    config_entry.data.get(CONF_SPEED_CONTROL),
+                    config_entry.data.get(CONF_OSCILLATION),
+                    config_entry.data.get(CONF_DIRECTION),
+                )
+            )
+
+    elif device_type == "air_purifier":
+        if power := config_entry.data.get(CONF_POWER_SWITCH):
+            entities.append(
+                HomeKitDeviceAirPurifier(
+                    context,
+                    f"{base_name} Purifier",
+                    power,
+                    config_entry.data.get(CONF_FILTER_LIFE),
+                )
+            )
+
+    if entities:
+        async_add_entities(entities)
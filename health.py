@@ -0,0 +1,154 @@
+"""Availability tracking of aggregated devices."""
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, State, callback
+from homeassistant.helpers.event import async_track_state_change
+
+from .device_fields import get_device_fields
+
+if TYPE_CHECKING:
+    from .scheduler import UpdateScheduler
+
+def source_available(state: State | None) -> bool:
+    """Return if a source entity exists and is available."""
+    return state is not None and state.state != STATE_UNAVAILABLE
+
+def _entity_ids(value: Any) -> list[str]:
+    if not value:
+        return []
+    return value if isinstance(value, list) else [value]
+
+class DeviceHealth:
+    """Availability of the sources behind an aggregated device.
+
+    The sources the device schema marks as required and optional are
+    counted as they become unavailable or available again, so the device
+    availability is a comparison of one counter. A device with a required
+    source missing is unavailable as a whole; a missing optional source
+    only makes its own proxies unavailable.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        scheduler: UpdateScheduler,
+        required: frozenset[str],
+        optional: frozenset[str],
+    ) -> None:
+        """Initialize the tracker, assuming every source is available."""
+        self._hass = hass
+        self._scheduler = scheduler
+        self.required = required
+        self.optional = optional
+        self.unavailable: set[str] = set()
+        self.required_unavailable = 0
+        self.optional_unavailable = 0
+        self._proxies: dict[str, dict[Any, None]] = {}
+        self._listeners: dict[Callable[[], None], None] = {}
+
+    @classmethod
+    def from_data(
+        cls,
+        hass: HomeAssistant,
+        scheduler: UpdateScheduler,
+        device_type: str,
+        data: Mapping[str, Any],
+    ) -> DeviceHealth:
+        """Build the tracker from the device schema and an entry's mapping."""
+        required: set[str] = set()
+        optional: set[str] = set()
+        for key, field in get_device_fields(device_type).items():
+            (required if field.required else optional).update(_entity_ids(data.get(key)))
+        return cls(hass, scheduler, frozenset(required), frozenset(optional - required))
+
+    @property
+    def available(self) -> bool:
+        """Return if every required source is available."""
+        return not self.required_unavailable
+
+    @property
+    def degraded(self) -> bool:
+        """Return if any source is unavailable."""
+        return bool(self.unavailable)
+
+    def proxy_available(self, entity_id: str) -> bool:
+        """Return if a proxy's source is available and the device as a whole is too."""
+        return not self.required_unavailable and entity_id not in self.unavailable
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Count the current availability and track changes to it."""
+        for entity_id in self.required | self.optional:
+            if not source_available(self._hass.states.get(entity_id)):
+                self._set_unavailable(entity_id)
+        return async_track_state_change(
+            self._hass, list(self.required | self.optional), self._async_source_changed
+        )
+
+    @callback
+    def async_add_proxy(self, proxy: Any, entity_id: str) -> CALLBACK_TYPE:
+        """Write a proxy whenever its availability changes."""
+        proxies = self._proxies.setdefault(entity_id, {})
+        proxies[proxy] = None
+        return lambda: proxies.pop(proxy, None)
+
+    @callback
+    def async_add_listener(self, listener: Callable[[], None]) -> CALLBACK_TYPE:
+        """Call a listener whenever any source changes availability."""
+        self._listeners[listener] = None
+        return lambda: self._listeners.pop(listener, None)
+
+    def _set_unavailable(self, entity_id: str) -> None:
+        self.unavailable.add(entity_id)
+        if entity_id in self.required:
+            self.required_unavailable += 1
+        else:
+            self.optional_unavailable += 1
+
+    def _set_available(self, entity_id: str) -> None:
+        self.unavailable.discard(entity_id)
+        if entity_id in self.required:
+            self.required_unavailable -= 1
+        else:
+            self.optional_unavailable -= 1
+
+    @callback
+    def _async_source_changed(
+        self, entity_id: str, old_state: State | None, new_state: State | None
+    ) -> None:
+        """Update the counters when a source changes availability."""
+        is_available = source_available(new_state)
+        if is_available == (entity_id not in self.unavailable):
+            return
+
+        was_available = self.available
+        if is_available:
+            self._set_available(entity_id)
+        else:
+            self._set_unavailable(entity_id)
+
+        if self.available != was_available:
+            # Every proxy of the device follows its required sources
+            for proxies in self._proxies.values():
+                for proxy in proxies:
+                    self._scheduler.async_write(proxy)
+        else:
+            for proxy in self._proxies.get(entity_id, ()):
+                self._scheduler.async_write(proxy)
+        for listener in list(self._listeners):
+            listener()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the availability counters for diagnostics."""
+        return {
+            "available": self.available,
+            "required_sources": len(self.required),
+            "optional_sources": len(self.optional),
+            "required_unavailable": self.required_unavailable,
+            "optional_unavailable": self.optional_unavailable,
+            "unavailable": sorted(self.unavailable),
+        }
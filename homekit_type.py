@@ -1,10 +1,19 @@
 """HomeKit device type definitions."""
-from homeassistant.const import (
-    UnitOfTemperature,
+from .const import (
+    CATEGORY_AIR_PURIFIER,
+    CATEGORY_HUMIDIFIER,
+    CATEGORY_KETTLE,
+    CONF_CURRENT_TEMP,
+    CONF_TARGET_TEMP,
+    CONF_POWER_SWITCH,
+    CONF_CURRENT_HUMIDITY,
+    CONF_TARGET_HUMIDITY,
+    CONF_WATER_LEVEL,
+    CONF_FILTER_LIFE,
 )
 
-# HomeKit Categories (from HAP-python)
-CATEGORY_KETTLE = 27
+# Matches homeassistant.const.UnitOfTemperature.CELSIUS
+UNIT_CELSIUS = "°C"
 
 # HomeKit Characteristic UUIDs (from HAP-python)
 CHAR_ON = "00000025-0000-1000-8000-0026BB765291"
@@ -12,10 +21,21 @@ CHAR_CURRENT_TEMPERATURE = "00000011-0000-1000-8000-0026BB765291"
 CHAR_TARGET_TEMPERATURE = "00000035-0000-1000-8000-0026BB765291"
 CHAR_HEATING_COOLING_CURRENT = "0000000F-0000-1000-8000-0026BB765291"
 CHAR_HEATING_COOLING_TARGET = "00000033-0000-1000-8000-0026BB765291"
+CHAR_ACTIVE = "000000B0-0000-1000-8000-0026BB765291"
+CHAR_CURRENT_HUMIDITY = "00000010-0000-1000-8000-0026BB765291"
+CHAR_HUMIDIFIER_THRESHOLD = "000000CA-0000-1000-8000-0026BB765291"
+CHAR_WATER_LEVEL = "000000B5-0000-1000-8000-0026BB765291"
+CHAR_CURRENT_HUMIDIFIER_STATE = "000000B3-0000-1000-8000-0026BB765291"
+CHAR_CURRENT_AIR_PURIFIER_STATE = "000000A9-0000-1000-8000-0026BB765291"
+CHAR_FILTER_CHANGE_INDICATION = "000000AC-0000-1000-8000-0026BB765291"
+CHAR_FILTER_LIFE_LEVEL = "000000AB-0000-1000-8000-0026BB765291"
 
 # HomeKit Service UUIDs (from HAP-python)
 SERVICE_THERMOSTAT = "0000004A-0000-1000-8000-0026BB765291"
 SERVICE_SWITCH = "00000049-0000-1000-8000-0026BB765291"
+SERVICE_HUMIDIFIER = "000000BD-0000-1000-8000-0026BB765291"
+SERVICE_AIR_PURIFIER = "000000BB-0000-1000-8000-0026BB765291"
+SERVICE_FILTER_MAINTENANCE = "000000BA-0000-1000-8000-0026BB765291"
 
 KETTLE_DEVICE_TYPE = {
     "category": CATEGORY_KETTLE,
@@ -28,7 +48,8 @@ KETTLE_DEVICE_TYPE = {
                 {
                     "name": "Current Temperature",
                     "char": CHAR_CURRENT_TEMPERATURE,
-                    "unit": UnitOfTemperature.CELSIUS,
+                    "key": CONF_CURRENT_TEMP,
+                    "unit": UNIT_CELSIUS,
                     "device_class": "temperature",
                     "min_value": 0,
                     "max_value": 100,
@@ -36,7 +57,8 @@ KETTLE_DEVICE_TYPE = {
                 {
                     "name": "Target Temperature",
                     "char": CHAR_TARGET_TEMPERATURE,
-                    "unit": UnitOfTemperature.CELSIUS,
+                    "key": CONF_TARGET_TEMP,
+                    "unit": UNIT_CELSIUS,
                     "min_value": 0,
                     "max_value": 100,
                     "step_value": 1,
@@ -61,6 +83,7 @@ KETTLE_DEVICE_TYPE = {
                 {
                     "name": "Power State",
                     "char": CHAR_ON,
+                    "key": CONF_POWER_SWITCH,
                     "device_class": "power",
                 },
             ],
@@ -68,10 +91,113 @@ KETTLE_DEVICE_TYPE = {
     ],
 }
 
+HUMIDIFIER_DEVICE_TYPE = {
+    "category": CATEGORY_HUMIDIFIER,
+    "services": [
+        {
+            "name": "Humidifier",
+            "service": SERVICE_HUMIDIFIER,
+            "primary": True,
+            "chars": [
+                {
+                    "name": "Active",
+                    "char": CHAR_ACTIVE,
+                    "key": CONF_POWER_SWITCH,
+                    "valid_values": [0, 1],  # 0: Inactive, 1: Active
+                },
+                {
+                    "name": "Current Relative Humidity",
+                    "char": CHAR_CURRENT_HUMIDITY,
+                    "key": CONF_CURRENT_HUMIDITY,
+                    "unit": "%",
+                    "min_value": 0,
+                    "max_value": 100,
+                },
+                {
+                    "name": "Humidifier Threshold",
+                    "char": CHAR_HUMIDIFIER_THRESHOLD,
+                    "key": CONF_TARGET_HUMIDITY,
+                    "unit": "%",
+                    "min_value": 0,
+                    "max_value": 100,
+                    "step_value": 1,
+                },
+                {
+                    "name": "Water Level",
+                    "char": CHAR_WATER_LEVEL,
+                    "key": CONF_WATER_LEVEL,
+                    "unit": "%",
+                    "min_value": 0,
+                    "max_value": 100,
+                },
+                {
+                    "name": "Current State",
+                    "char": CHAR_CURRENT_HUMIDIFIER_STATE,
+                    "valid_values": [0, 1, 2],  # 0: Inactive, 1: Idle, 2: Humidifying
+                },
+            ],
+        },
+    ],
+}
+
+AIR_PURIFIER_DEVICE_TYPE = {
+    "category": CATEGORY_AIR_PURIFIER,
+    "services": [
+        {
+            "name": "Air Purifier",
+            "service": SERVICE_AIR_PURIFIER,
+            "primary": True,
+            "chars": [
+                {
+                    "name": "Active",
+                    "char": CHAR_ACTIVE,
+                    "key": CONF_POWER_SWITCH,
+                    "valid_values": [0, 1],  # 0: Inactive, 1: Active
+                },
+                {
+                    "name": "Current State",
+                    "char": CHAR_CURRENT_AIR_PURIFIER_STATE,
+                    "valid_values": [0, 2],  # 0: Inactive, 2: Purifying
+                },
+            ],
+        },
+        {
+            "name": "Filter",
+            "service": SERVICE_FILTER_MAINTENANCE,
+            "linked": True,
+            "chars": [
+                {
+                    "name": "Filter Life Level",
+                    "char": CHAR_FILTER_LIFE_LEVEL,
+                    "key": CONF_FILTER_LIFE,
+                    "unit": "%",
+                    "min_value": 0,
+                    "max_value": 100,
+                },
+                {
+                    "name": "Filter Change Indication",
+                    "char": CHAR_FILTER_CHANGE_INDICATION,
+                    "valid_values": [0, 1],  # 0: Filter OK, 1: Change filter
+                },
+            ],
+        },
+    ],
+}
+
 DEVICE_TYPES = {
     "kettle": KETTLE_DEVICE_TYPE,
+    "humidifier": HUMIDIFIER_DEVICE_TYPE,
+    "air_purifier": AIR_PURIFIER_DEVICE_TYPE,
 }
 
 def get_device_type(device_type: str) -> dict:
     """Get the HomeKit device type configuration."""
     return DEVICE_TYPES.get(device_type, {})
+
+def get_characteristic(device_type: str, key: str) -> dict:
+    """Get the HomeKit characteristic a configuration key is mapped to."""
+    for service in get_device_type(device_type).get("services", []):
+        for char in service["chars"]:
+            if char.get("key") == key:
+                return char
+    return {}
@@ -0,0 +1,149 @@
+"""Platform for humidifier integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.humidifier import (
+    HumidifierAction,
+    HumidifierDeviceClass,
+    HumidifierEntity,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import STATE_ON
+from homeassistant.core import HomeAssistant, State
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import (
+    DOMAIN,
+    CONF_NAME,
+    CONF_POWER_SWITCH,
+    CONF_CURRENT_HUMIDITY,
+    CONF_TARGET_HUMIDITY,
+    CONF_WATER_LEVEL,
+)
+from .entity import HomeKitDeviceCompositeEntity
+from .homekit_type import CHAR_HUMIDIFIER_THRESHOLD
+from .models import HomeKitDeviceContext
+from .transforms import to_float
+
+class HomeKitDeviceHumidifier(HomeKitDeviceCompositeEntity, HumidifierEntity):
+    """Representation of a HomeKit Device humidifier.
+
+    Power, current and target humidity and water level sources are
+    combined into one humidifier that is only written when what it
+    publishes changes.
+    """
+
+    __slots__ = ("_target_entity", "_water_level")
+
+    _attr_device_class = HumidifierDeviceClass.HUMIDIFIER
+    _attr_homekit_char = CHAR_HUMIDIFIER_THRESHOLD
+
+    def __init__(
+        self,
+        context: HomeKitDeviceContext,
+        name: str,
+        power: str,
+        current: str | None = None,
+        target: str | None = None,
+        water_level: str | None = None,
+    ) -> None:
+        """Initialize the humidifier."""
+        super().__init__(context, name, power)
+        self._target_entity = target
+        self._water_level: float | None = None
+
+        self._add_source(power, self._apply_power)
+        if current:
+            self._add_source(current, self._apply_current, to_float)
+        if target:
+            self._add_source(target, self._apply_target, to_float)
+        if water_level:
+            self._add_source(water_level, self._apply_water_level, to_float)
+
+    @property
+    def action(self) -> HumidifierAction:
+        """Return whether the humidifier is humidifying."""
+        if not self._attr_is_on:
+            return HumidifierAction.OFF
+        current, target = self._attr_current_humidity, self._attr_target_humidity
+        if current is not None and target is not None and current < target:
+            return HumidifierAction.HUMIDIFYING
+        return HumidifierAction.IDLE
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return the water level."""
+        return {"water_level": self._water_level}
+
+    def _apply_power(self, state: State, value: Any) -> None:
+        self._attr_is_on = value == STATE_ON
+
+    def _apply_current(self, state: State, value: float | None) -> None:
+        self._attr_current_humidity = value
+
+    def _apply_target(self, state: State, value: float | None) -> None:
+        attributes = state.attributes
+        self._attr_target_humidity = value
+        self._attr_min_humidity = attributes.get("min", 0)
+        self._attr_max_humidity = attributes.get("max", 100)
+
+    def _apply_water_level(self, state: State, value: float | None) -> None:
+        self._water_level = value
+
+    def _build_snapshot(self) -> tuple:
+        """Return the values the humidifier publishes."""
+        return (
+            self._attr_is_on,
+            self._attr_current_humidity,
+            self._attr_target_humidity,
+            self._attr_min_humidity,
+            self._attr_max_humidity,
+            self._water_level,
+        )
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Turn the humidifier on."""
+        await self._async_set_power(True)
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Turn the humidifier off."""
+        await self._async_set_power(False)
+
+    async def async_set_humidity(self, humidity: int) -> None:
+        """Set the target humidity."""
+        if self._target_entity is None or humidity == self._attr_target_humidity:
+            return
+        await self.hass.services.async_call(
+            "number",
+            "set_value",
+            {"entity_id": self._target_entity, "value": humidity},
+        )
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the HomeKit Device humidifiers."""
+    context: HomeKitDeviceContext = hass.data[DOMAIN][config_entry.entry_id]
+    device_type = context.device_type
+    base_name = config_entry.data.get(CONF_NAME, "Smart Device")
+    entities = []
+
+    # Device-specific humidifiers
+    if device_type == "humidifier":
+        if power := config_entry.data.get(CONF_POWER_SWITCH):
+            entities.append(
+                HomeKitDeviceHumidifier(
+                    context,
+                    f"{base_name} Humidifier",
+                    power,
+                    config_entry.data.get(CONF_CURRENT_HUMIDITY),
+                    config_entry.data.get(CONF_TARGET_HUMIDITY),
+                    config_entry.data.get(CONF_WATER_LEVEL),
+                )
+            )
+
+    if entities:
+        async_add_entities(entities)
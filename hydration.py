@@ -0,0 +1,108 @@
+"""Batched initial state hydration for HomeKit Device Aggregator."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Final
+
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import HomeAssistant, State, callback
+from homeassistant.helpers.event import async_track_state_change
+
+if TYPE_CHECKING:
+    from .entity import HomeKitDeviceEntity
+    from .scheduler import UpdateScheduler
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+def source_ready(state: State | None) -> bool:
+    """Return if a source state is worth publishing."""
+    return state is not None and state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN)
+
+class EntryHydrator:
+    """Hydrates the proxies of an entry whose sources were not ready.
+
+    Proxies whose source already has a state apply it while they are
+    added, so their first write carries the real value. The rest are
+    held back until every pending source is ready, or the timeout
+    expires, and are then written together in one pass.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, name: str, scheduler: UpdateScheduler
+    ) -> None:
+        """Initialize the hydrator."""
+        self._hass = hass
+        self._scheduler = scheduler
+        self._name = name
+        self._started = time.monotonic()
+        self._pending: dict[HomeKitDeviceEntity, str] = {}
+        self.hydration_time: float | None = None
+
+    def is_pending(self, proxy: HomeKitDeviceEntity) -> bool:
+        """Return if a proxy is waiting for the batched hydration."""
+        return proxy in self._pending
+
+    @callback
+    def async_register(self, proxy: HomeKitDeviceEntity, source: str) -> State | None:
+        """Return the proxy's initial source state, or queue it if not ready."""
+        state = self._hass.states.get(source)
+        if source_ready(state) or self.hydration_time is not None:
+            return state
+        self._pending[proxy] = source
+        return None
+
+    @callback
+    def async_unregister(self, proxy: HomeKitDeviceEntity) -> None:
+        """Forget a proxy removed before it was hydrated."""
+        self._pending.pop(proxy, None)
+
+    async def async_hydrate(self, timeout: float) -> None:
+        """Wait for pending sources, then write every pending proxy at once."""
+        missing = {
+            source
+            for source in self._pending.values()
+            if not source_ready(self._hass.states.get(source))
+        }
+        if missing:
+            ready = asyncio.Event()
+
+            @callback
+            def _source_changed(entity_id, old_state, new_state) -> None:
+                if source_ready(new_state):
+                    missing.discard(entity_id)
+                if not missing:
+                    ready.set()
+
+            unsub = async_track_state_change(self._hass, list(missing), _source_changed)
+            try:
+                async with asyncio.timeout(timeout):
+                    await ready.wait()
+            except TimeoutError:
+                _LOGGER.warning(
+                    "Sources of %s not ready after %.0f seconds: %s",
+                    self._name,
+                    timeout,
+                    ", ".join(sorted(missing)),
+                )
+            finally:
+                unsub()
+
+        pending, self._pending = self._pending, {}
+        changed = []
+        for proxy, source in pending.items():
+            if (state := self._hass.states.get(source)) is not None and (
+                proxy.async_apply_source(state)
+            ):
+                changed.append(proxy)
+        for proxy in changed:
+            self._scheduler.async_write(proxy)
+
+        self.hydration_time = time.monotonic() - self._started
+        _LOGGER.debug(
+            "%s fully hydrated %.0f ms after setup started, %d proxies batched",
+            self._name,
+            self.hydration_time * 1000,
+            len(changed),
+        )
@@ -1,9 +1,16 @@
 """Platform for light integration."""
 from __future__ import annotations
 
-from homeassistant.components.light import LightEntity
+from homeassistant.components.light import (
+    ATTR_BRIGHTNESS,
+    ATTR_COLOR_TEMP_KELVIN,
+    ATTR_HS_COLOR,
+    ATTR_RGB_COLOR,
+    ColorMode,
+    LightEntity,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, State, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
@@ -12,12 +19,65 @@ from .const import (
     CONF_LIGHT_SWITCH,
 )
 from .entity import HomeKitDeviceEntity
+from .models import HomeKitDeviceContext
+from .light_tables import (
+    MAX_KELVIN,
+    MIN_KELVIN,
+    canonical_brightness,
+    canonical_kelvin,
+    hs_to_rgb,
+    mired_to_kelvin,
+    rgb_to_hs,
+)
+
+# Source colour modes and the mode the proxy reports them as
+COLOR_MODE_MAP = {
+    ColorMode.ONOFF: ColorMode.ONOFF,
+    ColorMode.BRIGHTNESS: ColorMode.BRIGHTNESS,
+    ColorMode.COLOR_TEMP: ColorMode.COLOR_TEMP,
+    ColorMode.HS: ColorMode.HS,
+    ColorMode.XY: ColorMode.HS,
+    ColorMode.RGB: ColorMode.HS,
+    ColorMode.RGBW: ColorMode.HS,
+    ColorMode.RGBWW: ColorMode.HS,
+    ColorMode.WHITE: ColorMode.WHITE,
+}
 
 class HomeKitDeviceLight(HomeKitDeviceEntity, LightEntity):
-    """Representation of a HomeKit Device light."""
+    """Representation of a HomeKit Device light.
+
+    Brightness, colour temperature and colour are snapped to values
+    HomeKit represents exactly, so a value written from the Home app and
+    reported back by the source does not trigger another update.
+    """
+
+    __slots__ = ("_snapshot",)
+
+    _attr_min_color_temp_kelvin = MIN_KELVIN
+    _attr_max_color_temp_kelvin = MAX_KELVIN
+
+    def __init__(
+        self,
+        context: HomeKitDeviceContext,
+        name: str,
+        entity_id: str,
+    ) -> None:
+        """Initialize the light."""
+        super().__init__(context, name, entity_id)
+        self._attr_supported_color_modes = {ColorMode.ONOFF}
+        self._attr_color_mode = ColorMode.ONOFF
+        self._snapshot: tuple | None = None
 
     async def async_turn_on(self, **kwargs) -> None:
         """Turn the light on."""
+        if ATTR_BRIGHTNESS in kwargs:
+            kwargs[ATTR_BRIGHTNESS] = canonical_brightness(kwargs[ATTR_BRIGHTNESS])
+        if ATTR_COLOR_TEMP_KELVIN in kwargs:
+            kwargs[ATTR_COLOR_TEMP_KELVIN] = canonical_kelvin(
+                kwargs[ATTR_COLOR_TEMP_KELVIN]
+            )
+        if ATTR_HS_COLOR in kwargs:
+            kwargs[ATTR_RGB_COLOR] = hs_to_rgb(*kwargs.pop(ATTR_HS_COLOR))
         await self.hass.services.async_call(
             "light", "turn_on",
             {"entity_id": self._source_entity, **kwargs}
@@ -30,16 +90,39 @@ class HomeKitDeviceLight(HomeKitDeviceEntity, LightEntity):
             {"entity_id": self._source_entity}
         )
 
-    async def async_update_from_source(self, state) -> None:
-        """Update the entity from the source entity state."""
-        self._attr_is_on = state.state == "on"
-        if "brightness" in state.attributes:
-            self._attr_brightness = state.attributes["brightness"]
-        if "color_temp" in state.attributes:
-            self._attr_color_temp = state.attributes["color_temp"]
-        if "rgb_color" in state.attributes:
-            self._attr_rgb_color = state.attributes["rgb_color"]
-        self.async_write_ha_state()
+    @callback
+    def async_apply_source(self, state: State) -> bool:
+        """Apply the source entity state."""
+        attributes = state.attributes
+        brightness = attributes.get("brightness")
+        if brightness is not None:
+            brightness = canonical_brightness(brightness)
+        kelvin = attributes.get("color_temp_kelvin")
+        if kelvin is None and (mireds := attributes.get("color_temp")) is not None:
+            kelvin = mired_to_kelvin(mireds)
+        elif kelvin is not None:
+            kelvin = canonical_kelvin(kelvin)
+        hs_color = None
+        if (rgb := attributes.get("rgb_color")) is not None:
+            hs_color = rgb_to_hs(*rgb)
+        color_mode = COLOR_MODE_MAP.get(attributes.get("color_mode"), ColorMode.ONOFF)
+        supported = attributes.get("supported_color_modes")
+
+        snapshot = (state.state, brightness, kelvin, hs_color, color_mode, supported)
+        if snapshot == self._snapshot:
+            return False
+        self._snapshot = snapshot
+
+        self._attr_is_on = self._transform(state.state) == "on"
+        self._attr_brightness = brightness
+        self._attr_color_temp_kelvin = kelvin
+        self._attr_hs_color = hs_color
+        self._attr_color_mode = color_mode
+        if supported:
+            self._attr_supported_color_modes = {
+                COLOR_MODE_MAP.get(mode, ColorMode.ONOFF) for mode in supported
+            }
+        return True
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -47,7 +130,8 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the HomeKit Device lights."""
-    device_type = hass.data[DOMAIN][config_entry.entry_id]["device_type"]
+    context: HomeKitDeviceContext = hass.data[DOMAIN][config_entry.entry_id]
+    device_type = context.device_type
     base_name = config_entry.data.get(CONF_NAME, "Smart Device")
     entities = []
 
@@ -56,8 +140,7 @@ async def async_setup_entry(
         if light_switch := config_entry.data.get(CONF_LIGHT_SWITCH):
             entities.append(
                 HomeKitDeviceLight(
-                    hass,
-                    config_entry.entry_id,
+                    context,
                     f"{base_name} Light",
                     light_switch,
                 )
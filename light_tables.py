@@ -0,0 +1,138 @@
+"""Precomputed Home Assistant <-> HomeKit lookup tables for lights.
+
+HomeKit stores brightness as a percentage, colour temperature in mireds
+and colour as integer hue and saturation, while Home Assistant uses a
+0-255 brightness, kelvin and RGB. Converting on every update with
+floating point maths makes values drift by one step after a round trip,
+which the bridge sees as a change. Every conversion here goes through a
+table whose outputs are fixed points: converting a value to HomeKit and
+back yields the same canonical value.
+"""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+import colorsys
+from functools import lru_cache
+from typing import Final
+
+MIN_MIREDS: Final = 140
+MAX_MIREDS: Final = 500
+MIN_KELVIN: Final = 2000
+MAX_KELVIN: Final = 7143
+MAX_HUE: Final = 360
+MAX_SATURATION: Final = 100
+
+def _pct_to_brightness(pct: int) -> int:
+    return round(pct * 255 / 100)
+
+def _brightness_to_pct(brightness: int) -> int:
+    # Any non-zero brightness is at least 1% so a dim light never reads as 0
+    return max(1, round(brightness * 100 / 255)) if brightness else 0
+
+PCT_TO_BRIGHTNESS: Final = tuple(_pct_to_brightness(pct) for pct in range(101))
+BRIGHTNESS_TO_PCT: Final = tuple(_brightness_to_pct(value) for value in range(256))
+# Brightness values HomeKit can represent exactly, indexed by any 0-255 value
+CANONICAL_BRIGHTNESS: Final = tuple(
+    PCT_TO_BRIGHTNESS[pct] for pct in BRIGHTNESS_TO_PCT
+)
+
+MIRED_TO_KELVIN: Final = tuple(
+    round(1_000_000 / mired) for mired in range(MIN_MIREDS, MAX_MIREDS + 1)
+)
+KELVIN_TO_MIRED: Final = tuple(
+    min(MAX_MIREDS, max(MIN_MIREDS, round(1_000_000 / kelvin)))
+    for kelvin in range(MIN_KELVIN, MAX_KELVIN + 1)
+)
+
+def brightness_to_pct(brightness: int) -> int:
+    """Return the HomeKit percentage for a 0-255 brightness."""
+    return BRIGHTNESS_TO_PCT[min(255, max(0, int(brightness)))]
+
+def pct_to_brightness(pct: int) -> int:
+    """Return the 0-255 brightness for a HomeKit percentage."""
+    return PCT_TO_BRIGHTNESS[min(100, max(0, int(pct)))]
+
+def canonical_brightness(brightness: int) -> int:
+    """Return the 0-255 brightness that survives a HomeKit round trip."""
+    return CANONICAL_BRIGHTNESS[min(255, max(0, int(brightness)))]
+
+def kelvin_to_mired(kelvin: int) -> int:
+    """Return the HomeKit mired value for a colour temperature in kelvin."""
+    return KELVIN_TO_MIRED[min(MAX_KELVIN, max(MIN_KELVIN, int(kelvin))) - MIN_KELVIN]
+
+def mired_to_kelvin(mired: int) -> int:
+    """Return the colour temperature in kelvin for a HomeKit mired value."""
+    return MIRED_TO_KELVIN[min(MAX_MIREDS, max(MIN_MIREDS, int(mired))) - MIN_MIREDS]
+
+def canonical_kelvin(kelvin: int) -> int:
+    """Return the colour temperature that survives a HomeKit round trip."""
+    return mired_to_kelvin(kelvin_to_mired(kelvin))
+
+def _pack_rgb(red: int, green: int, blue: int) -> int:
+    return red << 16 | green << 8 | blue
+
+def _hsv_to_rgb(hue: int, saturation: int) -> tuple[int, int, int]:
+    red, green, blue = colorsys.hsv_to_rgb(
+        hue / MAX_HUE, saturation / MAX_SATURATION, 1.0
+    )
+    return round(red * 255), round(green * 255), round(blue * 255)
+
+def _rgb_to_hs(red: int, green: int, blue: int) -> tuple[int, int]:
+    hue, saturation, _ = colorsys.rgb_to_hsv(red / 255, green / 255, blue / 255)
+    return round(hue * MAX_HUE) % MAX_HUE, round(saturation * MAX_SATURATION)
+
+class _ColorTables:
+    """Hue/saturation grid to RGB and its canonical inverse."""
+
+    def __init__(self) -> None:
+        """Build the tables."""
+        # Three bytes per (hue, saturation) cell, hue-major
+        self.hs_to_rgb = bytearray()
+        best: dict[int, int] = {}
+        for hue in range(MAX_HUE):
+            for saturation in range(MAX_SATURATION + 1):
+                rgb = _hsv_to_rgb(hue, saturation)
+                self.hs_to_rgb.extend(rgb)
+                packed = _pack_rgb(*rgb)
+                cell = hue * (MAX_SATURATION + 1) + saturation
+                # Prefer the cell a direct conversion of the RGB lands on
+                if packed not in best or _rgb_to_hs(*rgb) == (hue, saturation):
+                    best[packed] = cell
+        # Sorted parallel arrays keep the inverse compact and searchable
+        keys = sorted(best)
+        self.rgb_keys = array("I", keys)
+        self.rgb_cells = array("H", (best[key] for key in keys))
+
+    def rgb(self, hue: int, saturation: int) -> tuple[int, int, int]:
+        """Return the RGB colour of a grid cell."""
+        offset = (hue * (MAX_SATURATION + 1) + saturation) * 3
+        return tuple(self.hs_to_rgb[offset : offset + 3])
+
+    def canonical_hs(self, red: int, green: int, blue: int) -> tuple[int, int] | None:
+        """Return the canonical cell for an RGB colour the grid produces."""
+        packed = _pack_rgb(red, green, blue)
+        index = bisect_left(self.rgb_keys, packed)
+        if index == len(self.rgb_keys) or self.rgb_keys[index] != packed:
+            return None
+        return divmod(self.rgb_cells[index], MAX_SATURATION + 1)
+
+@lru_cache(maxsize=1)
+def _color_tables() -> _ColorTables:
+    """Build the colour tables the first time a colour light needs them."""
+    return _ColorTables()
+
+def hs_to_rgb(hue: float, saturation: float) -> tuple[int, int, int]:
+    """Return the RGB colour for a HomeKit hue and saturation."""
+    return _color_tables().rgb(
+        round(hue) % MAX_HUE, min(MAX_SATURATION, max(0, round(saturation)))
+    )
+
+@lru_cache(maxsize=1024)
+def rgb_to_hs(red: int, green: int, blue: int) -> tuple[int, int]:
+    """Return the canonical HomeKit hue and saturation for an RGB colour."""
+    tables = _color_tables()
+    if (hs := tables.canonical_hs(red, green, blue)) is not None:
+        return hs
+    # Colours off the grid snap to the nearest cell, then to its canonical form
+    return tables.canonical_hs(*tables.rgb(*_rgb_to_hs(red, green, blue)))
@@ -0,0 +1,72 @@
+"""Runtime models for HomeKit Device Aggregator."""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import DeviceInfo
+
+from .const import DOMAIN, CONF_NAME, CONF_DEVICE_TYPE, CONF_TRANSFORMS, CONF_WINDOWS
+from .health import DeviceHealth
+from .hydration import EntryHydrator
+from .rolling import resolve_windows
+from .scheduler import UpdateScheduler
+from .transforms import Transform, compile_transforms
+
+@dataclass(frozen=True, slots=True)
+class HomeKitDeviceContext:
+    """Per-entry state shared by every proxy of an aggregated device.
+
+    Built once when the entry is set up, so proxies neither look up
+    hass.data nor build their own DeviceInfo.
+    """
+
+    hass: HomeAssistant
+    entry_id: str
+    device_type: str
+    config: Mapping[str, Any]
+    identifier: str
+    device_info: DeviceInfo
+    transforms: Mapping[str, Transform]
+    windows: Mapping[str, tuple[int, ...]]
+    hydrator: EntryHydrator
+    scheduler: UpdateScheduler
+    health: DeviceHealth
+
+    @classmethod
+    def from_entry(
+        cls, hass: HomeAssistant, entry: ConfigEntry, scheduler: UpdateScheduler
+    ) -> HomeKitDeviceContext:
+        """Build the context for a config entry."""
+        device_type = entry.data.get(CONF_DEVICE_TYPE, "Unknown")
+        identifier = f"{DOMAIN}_{entry.entry_id}"
+        return cls(
+            hass=hass,
+            entry_id=entry.entry_id,
+            device_type=device_type,
+            config=MappingProxyType(dict(entry.data)),
+            identifier=identifier,
+            device_info=DeviceInfo(
+                identifiers={(DOMAIN, identifier)},
+                name=entry.data[CONF_NAME],
+                manufacturer="HomeKit Device Aggregator",
+                model=device_type.title(),
+                suggested_area="Kitchen" if device_type == "kettle" else None,
+                via_device=(DOMAIN, identifier),
+            ),
+            transforms=MappingProxyType(
+                compile_transforms(
+                    device_type, entry.data, entry.options.get(CONF_TRANSFORMS, {})
+                )
+            ),
+            windows=MappingProxyType(
+                resolve_windows(entry.data, entry.options.get(CONF_WINDOWS, {}))
+            ),
+            hydrator=EntryHydrator(hass, entry.title, scheduler),
+            scheduler=scheduler,
+            health=DeviceHealth.from_data(hass, scheduler, device_type, entry.data),
+        )
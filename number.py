@@ -4,7 +4,7 @@ from __future__ import annotations
 from homeassistant.components.number import NumberEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, State, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
@@ -13,7 +13,9 @@ from .const import (
     CONF_TARGET_TEMP,
 )
 from .entity import HomeKitDeviceEntity
+from .models import HomeKitDeviceContext
 from .homekit_type import CHAR_TARGET_TEMPERATURE
+from .transforms import Transform, to_float
 
 class HomeKitDeviceNumber(HomeKitDeviceEntity, NumberEntity):
     """Representation of a HomeKit Device number."""
@@ -27,13 +29,12 @@ class HomeKitDeviceNumber(HomeKitDeviceEntity, NumberEntity):
 
     def __init__(
         self,
-        hass: HomeAssistant,
-        entry_id: str,
+        context: HomeKitDeviceContext,
         name: str,
         entity_id: str,
     ) -> None:
         """Initialize the number."""
-        super().__init__(hass, entry_id, name, entity_id)
+        super().__init__(context, name, entity_id)
         self._attr_translation_key = "temperature"
         self._attr_homekit_char = CHAR_TARGET_TEMPERATURE
 
@@ -44,13 +45,17 @@ class HomeKitDeviceNumber(HomeKitDeviceEntity, NumberEntity):
             {"entity_id": self._source_entity, "value": value}
         )
 
-    async def async_update_from_source(self, state) -> None:
-        """Update the entity from the source entity state."""
-        try:
-            self._attr_native_value = float(state.state)
-            self.async_write_ha_state()
-        except ValueError:
-            pass
+    def _default_transform(self) -> Transform:
+        """Return the transform used when none is configured for the mapping."""
+        return to_float
+
+    @callback
+    def async_apply_source(self, state: State) -> bool:
+        """Apply the source entity state."""
+        if (value := self._transform(state.state)) is None:
+            return False
+        self._attr_native_value = value
+        return True
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -58,7 +63,8 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the HomeKit Device numbers."""
-    device_type = hass.data[DOMAIN][config_entry.entry_id]["device_type"]
+    context: HomeKitDeviceContext = hass.data[DOMAIN][config_entry.entry_id]
+    device_type = context.device_type
     base_name = config_entry.data.get(CONF_NAME, "Smart Device")
     entities = []
 
@@ -67,8 +73,7 @@ async def async_setup_entry(
         if target_temp := config_entry.data.get(CONF_TARGET_TEMP):
             entities.append(
                 HomeKitDeviceNumber(
-                    hass,
-                    config_entry.entry_id,
+                    context,
                     f"{base_name} Target Temperature",
                     target_temp,
                 )
@@ -0,0 +1,189 @@
+"""Rolling window statistics for sensor proxies."""
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from collections.abc import Mapping
+import math
+import time
+from typing import Any, Final
+
+# Samples kept per window: one per second of its length, within these bounds.
+# A busier source drops its oldest samples early, which shows as coverage below 1.
+WINDOW_MIN_CAPACITY: Final = 64
+WINDOW_MAX_CAPACITY: Final = 4096
+
+class RollingWindow:
+    """Time-weighted min, max, mean and standard deviation over a time window.
+
+    A source holds its value until it reports again, so each sample counts
+    for as long as it was the current value and the latest one is carried
+    forward to now: a value that holds steady stays in the window however
+    old its sample is. Samples live in ring buffers sized to the window
+    length. The minimum and maximum are kept in monotonic deques of
+    sample sequence numbers and the weighted sums of the samples that
+    have been superseded in running totals, so adding a sample and
+    reading the statistics are O(1) amortized whatever the window length.
+    """
+
+    __slots__ = (
+        "duration",
+        "_capacity",
+        "_values",
+        "_times",
+        "_head",
+        "_tail",
+        "_weight",
+        "_sum",
+        "_sum_sq",
+        "_min",
+        "_max",
+    )
+
+    def __init__(self, duration: float, capacity: int | None = None) -> None:
+        """Initialize an empty window of a duration in seconds."""
+        self.duration = duration
+        if capacity is None:
+            capacity = min(WINDOW_MAX_CAPACITY, max(WINDOW_MIN_CAPACITY, int(duration)))
+        self._capacity = capacity
+        self._values = array("d", bytes(8 * capacity))
+        self._times = array("d", bytes(8 * capacity))
+        # Sequence numbers of the oldest sample and of the next one
+        self._head = 0
+        self._tail = 0
+        # Seconds, and weighted sums, of the superseded samples
+        self._weight = 0.0
+        self._sum = 0.0
+        self._sum_sq = 0.0
+        self._min: deque[int] = deque()
+        self._max: deque[int] = deque()
+
+    def __len__(self) -> int:
+        """Return the number of samples in the window."""
+        return self._tail - self._head
+
+    def clear(self) -> None:
+        """Drop every sample."""
+        self._head = self._tail
+        self._weight = self._sum = self._sum_sq = 0.0
+        self._min.clear()
+        self._max.clear()
+
+    def _evict(self, now: float, room: int = 0) -> None:
+        """Drop samples superseded before the window, and any needed to make room."""
+        cutoff = now - self.duration
+        values, times, capacity = self._values, self._times, self._capacity
+        # The latest sample is current, so it is never dropped
+        while self._tail - self._head > 1:
+            end = times[(self._head + 1) % capacity]
+            if end > cutoff and self._tail - self._head <= capacity - room:
+                break
+            value = values[self._head % capacity]
+            weight = end - times[self._head % capacity]
+            self._weight -= weight
+            self._sum -= weight * value
+            self._sum_sq -= weight * value * value
+            self._head += 1
+        while self._min and self._min[0] < self._head:
+            self._min.popleft()
+        while self._max and self._max[0] < self._head:
+            self._max.popleft()
+
+    def add(self, value: float, now: float | None = None) -> None:
+        """Add a sample, superseding the current one."""
+        now = time.monotonic() if now is None else now
+        self._evict(now, 1)
+        values, times, capacity = self._values, self._times, self._capacity
+        seq = self._tail
+        if seq > self._head:
+            last = values[(seq - 1) % capacity]
+            weight = now - times[(seq - 1) % capacity]
+            self._weight += weight
+            self._sum += weight * last
+            self._sum_sq += weight * last * last
+        values[seq % capacity] = value
+        times[seq % capacity] = now
+        self._tail += 1
+        while self._min and values[self._min[-1] % capacity] >= value:
+            self._min.pop()
+        self._min.append(seq)
+        while self._max and values[self._max[-1] % capacity] <= value:
+            self._max.pop()
+        self._max.append(seq)
+
+    def next_expiry(self, now: float | None = None) -> float | None:
+        """Return when the oldest sample leaves the window, if another replaces it."""
+        self._evict(time.monotonic() if now is None else now)
+        if self._tail - self._head < 2:
+            return None
+        return self._times[(self._head + 1) % self._capacity] + self.duration
+
+    def statistics(self, now: float | None = None) -> dict[str, float | None]:
+        """Return the statistics of the window, weighted by time.
+
+        Coverage is the share of the window the samples span, below 1
+        until the window has filled or when samples were dropped for room.
+        """
+        now = time.monotonic() if now is None else now
+        self._evict(now)
+        if not len(self):
+            return {"min": None, "max": None, "mean": None, "stddev": None, "coverage": 0.0}
+        values, times, capacity = self._values, self._times, self._capacity
+        # The current sample counts until now
+        last = values[(self._tail - 1) % capacity]
+        elapsed = now - times[(self._tail - 1) % capacity]
+        weight = self._weight + elapsed
+        total = self._sum + elapsed * last
+        total_sq = self._sum_sq + elapsed * last * last
+        # The oldest sample only counts from the start of the window
+        first = values[self._head % capacity]
+        if (clipped := now - self.duration - times[self._head % capacity]) > 0:
+            weight -= clipped
+            total -= clipped * first
+            total_sq -= clipped * first * first
+        if weight > 0:
+            mean = total / weight
+            variance = max(0.0, total_sq / weight - mean * mean)
+        else:
+            mean, variance = last, 0.0
+        return {
+            "min": values[self._min[0] % capacity],
+            "max": values[self._max[0] % capacity],
+            "mean": mean,
+            "stddev": math.sqrt(variance),
+            "coverage": round(min(1.0, max(0.0, weight / self.duration)), 3),
+        }
+
+def window_label(duration: float) -> str:
+    """Return a short label such as ``10m`` or ``1h`` for a window."""
+    minutes = round(duration / 60)
+    if minutes % 60 == 0:
+        return f"{minutes // 60}h"
+    return f"{minutes}m"
+
+def parse_windows(text: str) -> list[int]:
+    """Parse comma separated window lengths in minutes."""
+    windows: set[int] = set()
+    for part in text.split(","):
+        if not (part := part.strip()):
+            continue
+        try:
+            minutes = int(part)
+        except ValueError as err:
+            raise ValueError(f"Invalid window: {part}") from err
+        if minutes <= 0:
+            raise ValueError(f"Invalid window: {part}")
+        windows.add(minutes)
+    return sorted(windows)
+
+def resolve_windows(
+    data: Mapping[str, Any], windows: Mapping[str, list[int]]
+) -> dict[str, tuple[int, ...]]:
+    """Return the configured window lengths in seconds, keyed by source entity id."""
+    resolved: dict[str, tuple[int, ...]] = {}
+    for key, minutes in windows.items():
+        if not (source := data.get(key)):
+            continue
+        for entity_id in source if isinstance(source, list) else [source]:
+            resolved[entity_id] = tuple(minute * 60 for minute in minutes)
+    return resolved
@@ -0,0 +1,237 @@
+"""Prioritised and rate limited proxy updates for HomeKit Device Aggregator."""
+from __future__ import annotations
+
+from collections import OrderedDict
+from enum import StrEnum
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, State, callback
+
+from .const import (
+    DEFAULT_WRITE_BURST,
+    DEFAULT_WRITE_RATE,
+    TELEMETRY_BATCH_SIZE,
+    TELEMETRY_QUEUE_SIZE,
+)
+
+if TYPE_CHECKING:
+    from asyncio import Handle, TimerHandle
+
+    from .entity import HomeKitDeviceBaseEntity, HomeKitDeviceEntity
+
+class UpdatePriority(StrEnum):
+    """How urgently a proxy's source updates are published."""
+
+    CONTROL = "control"
+    TELEMETRY = "telemetry"
+
+class TokenBucket:
+    """Token bucket refilled lazily from the monotonic clock."""
+
+    __slots__ = ("rate", "burst", "_tokens", "_updated")
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Initialize a full bucket."""
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def consume(self) -> bool:
+        """Take a token if one is available."""
+        self._refill()
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def delay(self) -> float:
+        """Return the seconds until the next token is available."""
+        self._refill()
+        return max(0.0, (1 - self._tokens) / self.rate)
+
+class UpdateScheduler:
+    """Publishes source updates of every proxy in the integration.
+
+    Control proxies, which mirror state a user acts on, are updated as
+    soon as their source changes. Telemetry proxies are queued and
+    written in small batches, each scheduled behind whatever else is
+    waiting on the event loop, so commands and control updates never
+    wait for a burst of sensor writes. The queue holds one entry per
+    proxy: a newer state replaces the queued one, and when the queue is
+    full the oldest proxy is shed until its source reports again.
+
+    State writes of every proxy also share a token bucket. A write over
+    budget marks the proxy dirty instead, and dirty proxies are written
+    with their latest state as tokens free up, control proxies first, so
+    a reconnect storm is spread out but always ends in the right state.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        max_size: int = TELEMETRY_QUEUE_SIZE,
+        batch_size: int = TELEMETRY_BATCH_SIZE,
+        write_rate: float = DEFAULT_WRITE_RATE,
+        write_burst: int = DEFAULT_WRITE_BURST,
+    ) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._max_size = max_size
+        self._batch_size = batch_size
+        self._queue: OrderedDict[HomeKitDeviceEntity, State] = OrderedDict()
+        self._drain: Handle | None = None
+        self._bucket = TokenBucket(write_rate, write_burst)
+        self._dirty: dict[UpdatePriority, dict[HomeKitDeviceBaseEntity, None]] = {
+            UpdatePriority.CONTROL: {},
+            UpdatePriority.TELEMETRY: {},
+        }
+        self._flush: TimerHandle | None = None
+        self.control_updates = 0
+        self.telemetry_updates = 0
+        self.merged = 0
+        self.shed = 0
+        self.peak_depth = 0
+        self.writes = 0
+        self.deferred_writes = 0
+        self.merged_writes = 0
+        self.storms = 0
+        self.storm_started: float | None = None
+        self.last_storm_duration: float | None = None
+        self.longest_storm_duration = 0.0
+        self._rate_second = 0
+        self._rate_count = 0
+        self.peak_rate = 0
+
+    @property
+    def depth(self) -> int:
+        """Return the number of queued telemetry updates."""
+        return len(self._queue)
+
+    @property
+    def dirty(self) -> int:
+        """Return the number of proxies waiting for a write token."""
+        return sum(len(dirty) for dirty in self._dirty.values())
+
+    @callback
+    def async_schedule(self, proxy: HomeKitDeviceEntity, state: State) -> None:
+        """Publish a source state now or queue it by the proxy's priority."""
+        if proxy.update_priority is UpdatePriority.CONTROL:
+            self.control_updates += 1
+            proxy.async_update_from_source(state)
+            return
+
+        queue = self._queue
+        if proxy in queue:
+            self.merged += 1
+        elif len(queue) >= self._max_size:
+            queue.popitem(last=False)
+            self.shed += 1
+        queue[proxy] = state
+        self.peak_depth = max(self.peak_depth, len(queue))
+        if self._drain is None:
+            self._drain = self._hass.loop.call_soon(self._async_drain)
+
+    @callback
+    def async_write(self, proxy: HomeKitDeviceBaseEntity) -> None:
+        """Write a proxy's state, or defer it until the budget allows."""
+        self._count_rate()
+        dirty = self._dirty[proxy.update_priority]
+        if proxy in dirty:
+            # The pending write will publish the newer state as well
+            self.merged_writes += 1
+            return
+        if self._flush is None and self._bucket.consume():
+            self.writes += 1
+            proxy.async_write_ha_state()
+            return
+
+        self.deferred_writes += 1
+        dirty[proxy] = None
+        if self.storm_started is None:
+            self.storm_started = time.monotonic()
+            self.storms += 1
+        if self._flush is None:
+            self._flush = self._hass.loop.call_later(
+                self._bucket.delay(), self._async_flush
+            )
+
+    @callback
+    def async_cancel(self, proxy: HomeKitDeviceBaseEntity) -> None:
+        """Drop the queued update and pending write of a removed proxy."""
+        self._queue.pop(proxy, None)
+        for dirty in self._dirty.values():
+            dirty.pop(proxy, None)
+
+    def _count_rate(self) -> None:
+        """Track the peak number of writes requested in one second."""
+        second = int(time.monotonic())
+        if second != self._rate_second:
+            self._rate_second = second
+            self._rate_count = 0
+        self._rate_count += 1
+        self.peak_rate = max(self.peak_rate, self._rate_count)
+
+    @callback
+    def _async_drain(self) -> None:
+        """Write one batch of telemetry and reschedule behind other work."""
+        self._drain = None
+        queue = self._queue
+        for _ in range(min(self._batch_size, len(queue))):
+            proxy, state = queue.popitem(last=False)
+            self.telemetry_updates += 1
+            proxy.async_update_from_source(state)
+        if queue:
+            self._drain = self._hass.loop.call_soon(self._async_drain)
+
+    @callback
+    def _async_flush(self) -> None:
+        """Write dirty proxies as far as the budget allows."""
+        self._flush = None
+        for dirty in self._dirty.values():
+            while dirty and self._bucket.consume():
+                proxy = next(iter(dirty))
+                del dirty[proxy]
+                self.writes += 1
+                proxy.async_write_ha_state()
+
+        if self.dirty:
+            self._flush = self._hass.loop.call_later(
+                self._bucket.delay(), self._async_flush
+            )
+        elif self.storm_started is not None:
+            duration = time.monotonic() - self.storm_started
+            self.storm_started = None
+            self.last_storm_duration = duration
+            self.longest_storm_duration = max(self.longest_storm_duration, duration)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the scheduler statistics for diagnostics."""
+        return {
+            "queue_depth": self.depth,
+            "peak_queue_depth": self.peak_depth,
+            "queue_size": self._max_size,
+            "control_updates": self.control_updates,
+            "telemetry_updates": self.telemetry_updates,
+            "merged": self.merged,
+            "shed": self.shed,
+            "write_budget": {
+                "rate": self._bucket.rate,
+                "burst": self._bucket.burst,
+                "writes": self.writes,
+                "deferred_writes": self.deferred_writes,
+                "merged_writes": self.merged_writes,
+                "dirty": self.dirty,
+                "peak_rate": self.peak_rate,
+                "storms": self.storms,
+                "storm_in_progress": self.storm_started is not None,
+                "last_storm_duration": self.last_storm_duration,
+                "longest_storm_duration": self.longest_storm_duration,
+            },
+        }
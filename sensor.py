@@ -1,12 +1,34 @@
 """Platform for sensor integration."""
 from __future__ import annotations
 
+from datetime import datetime, timedelta
+import math
+import time
+from typing import Any
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    ATTR_DEVICE_CLASS,
+    ATTR_UNIT_OF_MEASUREMENT,
+    CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
+    CONCENTRATION_PARTS_PER_BILLION,
+    PERCENTAGE,
+    UnitOfTemperature,
+    UnitOfTime,
+)
+from homeassistant.core import HomeAssistant, State, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_point_in_utc_time,
+)
+from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
+    CHAR_REMAINING_TIME,
+    COUNTDOWN_RESYNC_TOLERANCE,
     CONF_NAME,
     CONF_CURRENT_TEMP,
     CONF_STATUS_SENSOR,
@@ -19,7 +41,277 @@ from .const import (
     CONF_VOC,
     CONF_CURRENT_HUMIDITY,
 )
-from .entity import HomeKitDeviceSensor
+from .entity import HomeKitDeviceEntity
+from .homekit_type import CHAR_CURRENT_TEMPERATURE
+from .models import HomeKitDeviceContext
+from .rolling import RollingWindow, window_label
+from .scheduler import UpdatePriority
+from .transforms import (
+    Transform,
+    conversion_transform,
+    identity,
+    is_fraction_candidate,
+    reads_fraction,
+    to_float,
+    unit_transform,
+)
+
+class HomeKitDeviceSensor(HomeKitDeviceEntity, SensorEntity):
+    """Representation of a HomeKit Device sensor.
+
+    A sensor with a unit picks a cached transform normalizing its source's
+    value to the unit HomeKit expects, and only picks it again when the
+    source's unit changes. Home Assistant keeps the same attributes object
+    while they are unchanged, so most updates cost one identity check, and
+    other attribute changes one string comparison. A unitless humidity source may report
+    fractions or percentages, and its first reading that can only be one of
+    them fixes the transform for as long as the source keeps its unit.
+    """
+
+    __slots__ = (
+        "_windows",
+        "_cancel_expiry",
+        "_normalize",
+        "_unit_attributes",
+        "_source_unit",
+        "_fraction_pending",
+    )
+
+    update_priority = UpdatePriority.TELEMETRY
+
+    def __init__(
+        self,
+        context: HomeKitDeviceContext,
+        name: str,
+        entity_id: str,
+        unit: str | None = None,
+        device_class: SensorDeviceClass | None = None,
+    ) -> None:
+        """Initialize the sensor."""
+        self._attr_native_unit_of_measurement = unit
+        super().__init__(context, name, entity_id)
+        self._windows = tuple(
+            RollingWindow(duration) for duration in context.windows.get(entity_id, ())
+        )
+        self._cancel_expiry = None
+        self._attr_device_class = device_class
+        # A configured transform already produces the value in the right unit
+        self._normalize = unit is not None and entity_id not in context.transforms
+        self._unit_attributes = None
+        self._source_unit: str | None = None
+        self._fraction_pending = False
+
+        # Set HomeKit characteristics for temperature sensors
+        if device_class == SensorDeviceClass.TEMPERATURE:
+            self._attr_entity_category = None
+            self._attr_translation_key = "temperature"
+            self._attr_homekit_char = CHAR_CURRENT_TEMPERATURE
+
+    def _default_transform(self) -> Transform:
+        """Return the transform used when none is configured for the mapping."""
+        # Sensors with a unit are numeric, the rest report free-form states
+        return to_float if self._attr_native_unit_of_measurement else identity
+
+    async def async_added_to_hass(self) -> None:
+        """Run when entity is added to hass."""
+        if self._windows:
+            self.async_on_remove(self._async_cancel_expiry)
+        await super().async_added_to_hass()
+
+    @callback
+    def _async_cancel_expiry(self) -> None:
+        """Cancel the pending statistics refresh."""
+        if self._cancel_expiry is not None:
+            self._cancel_expiry()
+            self._cancel_expiry = None
+
+    @callback
+    def _async_schedule_expiry(self) -> None:
+        """Refresh the statistics when the next sample leaves a window."""
+        if self._cancel_expiry is not None:
+            return
+        now = time.monotonic()
+        expiries = [
+            expiry
+            for window in self._windows
+            if (expiry := window.next_expiry(now)) is not None
+        ]
+        if expiries:
+            self._cancel_expiry = async_call_later(
+                self.hass, min(expiries) - now, self._async_window_expired
+            )
+
+    @callback
+    def _async_window_expired(self, now: datetime) -> None:
+        """Write the statistics without the samples that left a window."""
+        self._cancel_expiry = None
+        self._context.scheduler.async_write(self)
+        self._async_schedule_expiry()
+
+    @property
+    def extra_state_attributes(self) -> dict | None:
+        """Return the rolling statistics of each configured window."""
+        if not self._windows:
+            return None
+        now = time.monotonic()
+        attributes = {}
+        for window in self._windows:
+            label = window_label(window.duration)
+            for stat, value in window.statistics(now).items():
+                attributes[f"{stat}_{label}"] = value
+        return attributes
+
+    @callback
+    def _async_resolve_unit(self, state: State) -> None:
+        """Pick the transform again if the source's attributes changed its unit."""
+        attributes = state.attributes
+        source_unit = attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        resolved = self._unit_attributes is not None
+        self._unit_attributes = attributes
+        if resolved and source_unit == self._source_unit:
+            return
+        self._source_unit = source_unit
+        native_unit = self._attr_native_unit_of_measurement
+        self._fraction_pending = is_fraction_candidate(
+            source_unit,
+            native_unit,
+            self._attr_device_class or attributes.get(ATTR_DEVICE_CLASS),
+        )
+        self._async_set_transform(unit_transform(source_unit, native_unit))
+
+    @callback
+    def _async_set_transform(self, transform: Transform) -> None:
+        """Read the source with another transform."""
+        if transform is not self._transform:
+            # Samples read with the old converter are in the wrong unit
+            for window in self._windows:
+                window.clear()
+            self._transform = transform
+
+    @callback
+    def _async_read_source(self, state: State) -> Any:
+        """Return the source's value in the unit of the proxy."""
+        if self._normalize and state.attributes is not self._unit_attributes:
+            self._async_resolve_unit(state)
+        if self._fraction_pending:
+            fraction = reads_fraction(to_float(state.state))
+            if fraction is not None:
+                self._fraction_pending = False
+                if fraction:
+                    self._async_set_transform(conversion_transform("fraction_to_percent"))
+        return self._transform(state.state)
+
+    @callback
+    def async_apply_source(self, state: State) -> bool:
+        """Apply the source entity state."""
+        value = self._attr_native_value = self._async_read_source(state)
+        self._async_add_sample(value)
+        return True
+
+    @callback
+    def _async_add_sample(self, value: Any) -> None:
+        """Add a numeric source value to the rolling windows."""
+        if self._windows and isinstance(value, (int, float)):
+            now = time.monotonic()
+            for window in self._windows:
+                window.add(value, now)
+            self._async_schedule_expiry()
+
+class HomeKitDeviceCountdownSensor(HomeKitDeviceSensor):
+    """Representation of a HomeKit Device countdown timer.
+
+    The source's remaining minutes are turned into an end time which is
+    extrapolated locally, so the proxy only changes state once a minute
+    however often the source reports. Source updates that agree with the
+    end time within COUNTDOWN_RESYNC_TOLERANCE seconds are ignored.
+    """
+
+    __slots__ = ("_end", "_cancel_refresh")
+
+    _attr_homekit_char = CHAR_REMAINING_TIME
+
+    def __init__(self, context: HomeKitDeviceContext, name: str, entity_id: str) -> None:
+        """Initialize the countdown sensor."""
+        super().__init__(
+            context, name, entity_id, UnitOfTime.MINUTES, SensorDeviceClass.DURATION
+        )
+        self._end: datetime | None = None
+        self._cancel_refresh = None
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return the rolling statistics and the extrapolated end time."""
+        attributes = super().extra_state_attributes or {}
+        attributes["end_time"] = self._end.isoformat() if self._end else None
+        return attributes
+
+    async def async_added_to_hass(self) -> None:
+        """Run when entity is added to hass."""
+        self.async_on_remove(self._async_cancel_refresh)
+        await super().async_added_to_hass()
+
+    @callback
+    def _async_cancel_refresh(self) -> None:
+        """Cancel the pending local refresh."""
+        if self._cancel_refresh is not None:
+            self._cancel_refresh()
+            self._cancel_refresh = None
+
+    @callback
+    def async_apply_source(self, state: State) -> bool:
+        """Update the end time when the source diverges from it."""
+        remaining = self._async_read_source(state)
+        # The statistics follow the source, however the end time is kept
+        self._async_add_sample(remaining)
+        if remaining is None or remaining <= 0:
+            end = None
+        else:
+            end = dt_util.utcnow() + timedelta(minutes=remaining)
+
+        if end is None:
+            value = None if remaining is None else 0
+            if self._end is None and self._attr_native_value == value:
+                return False
+            self._async_cancel_refresh()
+            self._end = None
+            self._attr_native_value = value
+            return True
+
+        if (
+            self._end is not None
+            and abs((end - self._end).total_seconds()) <= COUNTDOWN_RESYNC_TOLERANCE
+        ):
+            return False
+
+        self._end = end
+        self._async_update_remaining(dt_util.utcnow())
+        return True
+
+    @callback
+    def _async_update_remaining(self, now: datetime) -> None:
+        """Set the remaining minutes and schedule the next change."""
+        self._async_cancel_refresh()
+        remaining = (self._end - now).total_seconds()
+        if remaining <= 0:
+            self._end = None
+            self._attr_native_value = 0
+            return
+
+        minutes = math.ceil(remaining / 60)
+        self._attr_native_value = minutes
+        # The displayed value drops when the remaining time crosses a minute
+        self._cancel_refresh = async_track_point_in_utc_time(
+            self.hass,
+            self._async_refresh,
+            self._end - timedelta(minutes=minutes - 1),
+        )
+
+    @callback
+    def _async_refresh(self, now: datetime) -> None:
+        """Write the locally extrapolated remaining minutes."""
+        self._cancel_refresh = None
+        self._async_update_remaining(now)
+        self._context.scheduler.async_write(self)
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -27,7 +319,8 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the HomeKit Device sensors."""
-    device_type = hass.data[DOMAIN][config_entry.entry_id]["device_type"]
+    context: HomeKitDeviceContext = hass.data[DOMAIN][config_entry.entry_id]
+    device_type = context.device_type
     base_name = config_entry.data.get(CONF_NAME, "Smart Device")
     entities = []
 
@@ -35,8 +328,7 @@ async def async_setup_entry(
     if status_sensor := config_entry.data.get(CONF_STATUS_SENSOR):
         entities.append(
             HomeKitDeviceSensor(
-                hass,
-                config_entry.entry_id,
+                context,
                 f"{base_name} Status",
                 status_sensor,
             )
@@ -47,28 +339,25 @@ async def async_setup_entry(
         if current_temp := config_entry.data.get(CONF_CURRENT_TEMP):
             entities.append(
                 HomeKitDeviceSensor(
-                    hass,
-                    config_entry.entry_id,
+                    context,
                     f"{base_name} Temperature",
                     current_temp,
-                    "°C",
+                    UnitOfTemperature.CELSIUS,
+                    SensorDeviceClass.TEMPERATURE,
                 )
             )
         if countdown := config_entry.data.get(CONF_COUNTDOWN):
             entities.append(
-                HomeKitDeviceSensor(
-                    hass,
-                    config_entry.entry_id,
+                HomeKitDeviceCountdownSensor(
+                    context,
                     f"{base_name} Countdown",
                     countdown,
-                    "min",
                 )
             )
         if fault := config_entry.data.get(CONF_FAULT):
             entities.append(
                 HomeKitDeviceSensor(
-                    hass,
-                    config_entry.entry_id,
+                    context,
                     f"{base_name} Fault",
                     fault,
                 )
@@ -78,21 +367,20 @@ async def async_setup_entry(
         if current_humidity := config_entry.data.get(CONF_CURRENT_HUMIDITY):
             entities.append(
                 HomeKitDeviceSensor(
-                    hass,
-                    config_entry.entry_id,
+                    context,
                     f"{base_name} Humidity",
                     current_humidity,
-                    "%",
+                    PERCENTAGE,
+                    SensorDeviceClass.HUMIDITY,
                 )
             )
         if water_level := config_entry.data.get(CONF_WATER_LEVEL):
             entities.append(
                 HomeKitDeviceSensor(
-                    hass,
-                    config_entry.entry_id,
+                    context,
                     f"{base_name} Water Level",
                     water_level,
-                    "%",
+                    PERCENTAGE,
                 )
             )
 
@@ -100,8 +388,7 @@ async def async_setup_entry(
         if air_quality := config_entry.data.get(CONF_AIR_QUALITY):
             entities.append(
                 HomeKitDeviceSensor(
-                    hass,
-                    config_entry.entry_id,
+                    context,
                     f"{base_name} Air Quality",
                     air_quality,
                 )
@@ -109,31 +396,30 @@ async def async_setup_entry(
         if filter_life := config_entry.data.get(CONF_FILTER_LIFE):
             entities.append(
                 HomeKitDeviceSensor(
-                    hass,
-                    config_entry.entry_id,
+                    context,
                     f"{base_name} Filter Life",
                     filter_life,
-                    "%",
+                    PERCENTAGE,
                 )
             )
         if pm25 := config_entry.data.get(CONF_PM25):
             entities.append(
                 HomeKitDeviceSensor(
-                    hass,
-                    config_entry.entry_id,
+                    context,
                     f"{base_name} PM2.5",
                     pm25,
-                    "µg/m³",
+                    CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
+                    SensorDeviceClass.PM25,
                 )
             )
         if voc := config_entry.data.get(CONF_VOC):
             entities.append(
                 HomeKitDeviceSensor(
-                    hass,
-                    config_entry.entry_id,
+                    context,
                     f"{base_name} VOC",
                     voc,
-                    "ppb",
+                    CONCENTRATION_PARTS_PER_BILLION,
+                    SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS_PARTS,
                 )
             )
 
@@ -0,0 +1,89 @@
+"""Placement of aggregated devices across HomeKit bridges."""
+from __future__ import annotations
+
+from bisect import bisect
+from hashlib import blake2b
+from typing import Any, Final
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+
+from .const import DOMAIN, CONF_PREVIOUS_SHARDS, CONF_SHARDS
+from .models import HomeKitDeviceContext
+
+# Points per shard on the ring, enough to keep shards within a few percent
+VIRTUAL_NODES: Final = 128
+
+BRIDGE_SHARDS_SCHEMA: Final = vol.Schema(
+    {
+        vol.Required(CONF_SHARDS): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional(CONF_PREVIOUS_SHARDS): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    }
+)
+
+def _hash(key: str) -> int:
+    return int.from_bytes(blake2b(key.encode(), digest_size=8).digest(), "big")
+
+class ShardRing:
+    """Consistent hash ring of bridge shards.
+
+    Each shard owns VIRTUAL_NODES points on the ring and a device belongs
+    to the first point after its hash. Adding a shard only takes devices
+    from existing shards onto the new one, and removing one only moves
+    its own devices, so changing the shard count moves as few devices as
+    possible.
+    """
+
+    __slots__ = ("shards", "_points", "_owners")
+
+    def __init__(self, shards: int) -> None:
+        """Build the ring."""
+        self.shards = shards
+        ring = sorted(
+            (_hash(f"shard-{shard}-{node}"), shard)
+            for shard in range(shards)
+            for node in range(VIRTUAL_NODES)
+        )
+        self._points = [point for point, _ in ring]
+        self._owners = [shard for _, shard in ring]
+
+    def shard(self, identifier: str) -> int:
+        """Return the shard of a device identifier."""
+        return self._owners[bisect(self._points, _hash(identifier)) % len(self._points)]
+
+@callback
+def async_bridge_shards(
+    hass: HomeAssistant, shards: int, previous_shards: int | None = None
+) -> dict[str, Any]:
+    """Return the include filter of each bridge shard and any moved devices."""
+    entity_registry = er.async_get(hass)
+    ring = ShardRing(shards)
+    previous = ShardRing(previous_shards) if previous_shards else None
+    placement: list[dict[str, Any]] = [
+        {"shard": shard, "devices": [], "filter": {"include_entities": []}}
+        for shard in range(shards)
+    ]
+    moved: list[dict[str, Any]] = []
+
+    context: HomeKitDeviceContext
+    for context in hass.data[DOMAIN].values():
+        name = context.device_info["name"]
+        shard = ring.shard(context.identifier)
+        placement[shard]["devices"].append(name)
+        placement[shard]["filter"]["include_entities"].extend(
+            sorted(
+                entry.entity_id
+                for entry in er.async_entries_for_config_entry(
+                    entity_registry, context.entry_id
+                )
+            )
+        )
+        if previous and (old := previous.shard(context.identifier)) != shard:
+            moved.append({"device": name, "from": old, "to": shard})
+
+    result: dict[str, Any] = {"shards": placement}
+    if previous:
+        result["moved"] = moved
+    return result
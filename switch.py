@@ -3,19 +3,53 @@ from __future__ import annotations
 
 from typing import Any
 
+from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import STATE_ON
+from homeassistant.core import HomeAssistant, State, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
     DOMAIN,
     CONF_NAME,
     CONF_POWER_SWITCH,
-    CONF_OSCILLATION,
-    CONF_SIREN,
     CONF_KEEP_WARM,
 )
-from .entity import HomeKitDeviceSwitch
+from .entity import HomeKitDeviceEntity
+from .models import HomeKitDeviceContext
+
+# Device types whose power switch is part of a composite entity
+COMPOSITE_POWER_DEVICE_TYPES = ("fan", "humidifier", "air_purifier")
+
+class HomeKitDeviceSwitch(HomeKitDeviceEntity, SwitchEntity):
+    """Representation of a HomeKit Device switch."""
+
+    _attr_device_class = "switch"
+
+    async def async_turn_on(self, **kwargs) -> None:
+        """Turn the entity on."""
+        await self.hass.services.async_call(
+            "switch", "turn_on", {"entity_id": self._source_entity}
+        )
+
+    async def async_turn_off(self, **kwargs) -> None:
+        """Turn the entity off."""
+        await self.hass.services.async_call(
+            "switch", "turn_off", {"entity_id": self._source_entity}
+        )
+
+    @callback
+    def async_apply_source(self, state: State) -> bool:
+        """Apply the source entity state."""
+        self._attr_is_on = self._transform(state.state) == STATE_ON
+        return True
+
+class HomeKitDeviceKeepWarmSwitch(HomeKitDeviceSwitch):
+    """Representation of a kettle keep warm switch."""
+
+    _attr_entity_category = None
+    _attr_translation_key = "keep_warm"
+    _attr_icon = "mdi:kettle-steam"
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -23,42 +57,30 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the HomeKit Device switches."""
-    device_type = hass.data[DOMAIN][config_entry.entry_id]["device_type"]
+    context: HomeKitDeviceContext = hass.data[DOMAIN][config_entry.entry_id]
+    device_type = context.device_type
     base_name = config_entry.data.get(CONF_NAME, "Smart Device")
     entities = []
 
-    # Common power switch for all device types
+    # Common power switch, folded into the composite entity of these devices
     power_switch = config_entry.data.get(CONF_POWER_SWITCH)
-    if power_switch:
+    if power_switch and device_type not in COMPOSITE_POWER_DEVICE_TYPES:
         entities.append(
             HomeKitDeviceSwitch(
-                hass,
-                config_entry.entry_id,
+                context,
                 f"{base_name} Power",
                 power_switch,
             )
         )
 
     # Device-specific switches
-    if device_type == "fan":
-        if oscillation := config_entry.data.get(CONF_OSCILLATION):
-            entities.append(
-                HomeKitDeviceSwitch(
-                    hass,
-                    config_entry.entry_id,
-                    f"{base_name} Oscillation",
-                    oscillation,
-                )
-            )
-
-    elif device_type == "security_system":
-        if siren := config_entry.data.get(CONF_SIREN):
+    if device_type == "kettle":
+        if keep_warm := config_entry.data.get(CONF_KEEP_WARM):
             entities.append(
-                HomeKitDeviceSwitch(
-                    hass,
-                    config_entry.entry_id,
-                    f"{base_name} Siren",
-                    siren,
+                HomeKitDeviceKeepWarmSwitch(
+                    context,
+                    f"{base_name} Keep Warm",
+                    keep_warm,
                 )
             )
 
@@ -0,0 +1,254 @@
+"""Value transforms for HomeKit Device Aggregator mappings."""
+from __future__ import annotations
+
+import ast
+from collections.abc import Callable, Mapping
+from functools import lru_cache
+from typing import Any, Final
+
+from homeassistant.const import PERCENTAGE, UnitOfTemperature, UnitOfTime
+
+from .const import (
+    CONF_CLAMP,
+    CONF_CONVERSION,
+    CONF_EXPRESSION,
+    CONF_OFFSET,
+    CONF_SCALE,
+    CONF_VALUE_MAP,
+    VALUE_MAP_DEFAULT,
+)
+from .homekit_type import get_characteristic
+
+Transform = Callable[[Any], Any]
+
+UNIT_CONVERSIONS: Final[dict[str, Callable[[float], float]]] = {
+    "fahrenheit_to_celsius": lambda value: (value - 32) * 5 / 9,
+    "celsius_to_fahrenheit": lambda value: value * 9 / 5 + 32,
+    "kelvin_to_celsius": lambda value: value - 273.15,
+    "fraction_to_percent": lambda value: value * 100,
+    "seconds_to_minutes": lambda value: value / 60,
+    "minutes_to_seconds": lambda value: value * 60,
+}
+
+# Conversions from a source's unit to the unit a proxy publishes
+UNIT_NORMALIZATIONS: Final[dict[tuple[str | None, str], str]] = {
+    (UnitOfTemperature.FAHRENHEIT, UnitOfTemperature.CELSIUS): "fahrenheit_to_celsius",
+    (UnitOfTemperature.KELVIN, UnitOfTemperature.CELSIUS): "kelvin_to_celsius",
+    (UnitOfTime.SECONDS, UnitOfTime.MINUTES): "seconds_to_minutes",
+}
+
+# Device classes whose unitless sources report a 0-1 fraction instead of a percentage
+FRACTION_DEVICE_CLASSES: Final = frozenset({"humidity", "moisture"})
+
+_EXPRESSION_FUNCTIONS: Final = {
+    "abs": abs,
+    "round": round,
+    "min": min,
+    "max": max,
+}
+
+# Largest exponent an expression may raise a value to
+MAX_EXPONENT: Final = 8
+
+_EXPRESSION_NODES: Final = (
+    ast.Expression,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Constant,
+    ast.Name,
+    ast.Load,
+    ast.Call,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.FloorDiv,
+    ast.Mod,
+    ast.Pow,
+    ast.USub,
+    ast.UAdd,
+)
+
+class InvalidTransform(ValueError):
+    """Error raised when a transform cannot be compiled."""
+
+def identity(value: Any) -> Any:
+    """Return the source value unchanged."""
+    return value
+
+def to_float(value: Any) -> float | None:
+    """Return the source value as a float, or None if it is not numeric."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+@lru_cache(maxsize=16)
+def conversion_transform(conversion: str) -> Transform:
+    """Return a transform reading a numeric source through a unit conversion."""
+    convert = UNIT_CONVERSIONS[conversion]
+
+    def _convert(value: Any) -> float | None:
+        result = to_float(value)
+        return None if result is None else convert(result)
+
+    return _convert
+
+def unit_transform(source_unit: str | None, unit: str) -> Transform:
+    """Return a transform reading a numeric source in its unit as another unit.
+
+    Sources already in the unit, or in a unit with no known conversion,
+    are only read as floats.
+    """
+    if conversion := UNIT_NORMALIZATIONS.get((source_unit, unit)):
+        return conversion_transform(conversion)
+    return to_float
+
+def is_fraction_candidate(
+    source_unit: str | None, unit: str, device_class: str | None
+) -> bool:
+    """Return if a source may report a 0-1 fraction where a percentage is expected.
+
+    Such a source has no unit saying which it reports, so the choice is
+    left to its first reading that can only be one of them.
+    """
+    return (
+        source_unit is None
+        and unit == PERCENTAGE
+        and device_class in FRACTION_DEVICE_CLASSES
+    )
+
+def reads_fraction(value: float | None) -> bool | None:
+    """Return if a reading is a fraction, or None if it could be either."""
+    if value is None or value <= 0 or value == 1:
+        return None
+    return value < 1
+
+def _constant(node: ast.AST) -> float | None:
+    """Return the value of a possibly negated numeric constant node."""
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        value = _constant(node.operand)
+        if value is None or isinstance(node.op, ast.UAdd):
+            return value
+        return -value
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return node.value
+    return None
+
+def compile_expression(expression: str) -> Callable[[float], float]:
+    """Compile an arithmetic expression of ``x`` into a function."""
+    try:
+        tree = ast.parse(expression, mode="eval")
+    except SyntaxError as err:
+        raise InvalidTransform(f"Invalid expression: {expression}") from err
+
+    for node in ast.walk(tree):
+        if not isinstance(node, _EXPRESSION_NODES):
+            raise InvalidTransform(f"Unsupported syntax in expression: {expression}")
+        if isinstance(node, ast.Name) and node.id not in ("x", *_EXPRESSION_FUNCTIONS):
+            raise InvalidTransform(f"Unknown name {node.id} in expression")
+        if isinstance(node, ast.Call) and not (
+            isinstance(node.func, ast.Name) and node.func.id in _EXPRESSION_FUNCTIONS
+        ):
+            raise InvalidTransform(f"Unsupported call in expression: {expression}")
+        if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+            raise InvalidTransform(f"Unsupported constant in expression: {expression}")
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Pow):
+            exponent = _constant(node.right)
+            if exponent is None or abs(exponent) > MAX_EXPONENT:
+                raise InvalidTransform(
+                    f"Exponents must be constants up to {MAX_EXPONENT}: {expression}"
+                )
+            # A power of a power multiplies the exponents, so (9 ** 8) ** 8 ** ...
+            # would still build huge integers
+            if any(
+                isinstance(inner, ast.BinOp) and isinstance(inner.op, ast.Pow)
+                for inner in ast.walk(node.left)
+            ):
+                raise InvalidTransform(f"Powers cannot be nested: {expression}")
+
+    return eval(  # pylint: disable=eval-used
+        compile(f"lambda x: ({expression})", "<transform>", "eval"),
+        {"__builtins__": {}, **_EXPRESSION_FUNCTIONS},
+    )
+
+def parse_value_map(text: str) -> dict[str, str]:
+    """Parse ``from=to`` pairs separated by commas into a value map."""
+    value_map: dict[str, str] = {}
+    for pair in text.split(","):
+        if not pair.strip():
+            continue
+        source, sep, target = pair.partition("=")
+        if not sep or not source.strip():
+            raise InvalidTransform(f"Invalid value mapping: {pair}")
+        value_map[source.strip()] = target.strip()
+    return value_map
+
+def compile_transform(
+    spec: Mapping[str, Any], char: Mapping[str, Any] | None = None
+) -> Transform:
+    """Compile a transform spec into a single closure.
+
+    Stages run in a fixed order: value remapping, unit conversion,
+    scale and offset, expression and finally clamping to the HomeKit
+    characteristic limits. Stages that are not configured are left out
+    of the closure entirely.
+    """
+    value_map = spec.get(CONF_VALUE_MAP) or None
+    steps: list[Callable[[float], float]] = []
+
+    if conversion := spec.get(CONF_CONVERSION):
+        if conversion not in UNIT_CONVERSIONS:
+            raise InvalidTransform(f"Unknown unit conversion: {conversion}")
+        steps.append(UNIT_CONVERSIONS[conversion])
+
+    scale = float(spec.get(CONF_SCALE, 1))
+    offset = float(spec.get(CONF_OFFSET, 0))
+    if scale != 1 or offset != 0:
+        steps.append(lambda value: value * scale + offset)
+
+    if expression := spec.get(CONF_EXPRESSION):
+        steps.append(compile_expression(expression))
+
+    if spec.get(CONF_CLAMP) and char:
+        low = char.get("min_value", float("-inf"))
+        high = char.get("max_value", float("inf"))
+        steps.append(lambda value: low if value < low else high if value > high else value)
+
+    lookup = value_map.get if value_map else None
+    default = value_map.get(VALUE_MAP_DEFAULT) if value_map else None
+
+    if not steps:
+        if lookup is None:
+            return identity
+        if default is None:
+            return lambda value: lookup(value, value)
+        return lambda value: lookup(value, default)
+
+    def _numeric(value: Any) -> float | None:
+        if lookup is not None:
+            value = lookup(value, value if default is None else default)
+        try:
+            result = float(value)
+            for step in steps:
+                result = step(result)
+        except (ArithmeticError, TypeError, ValueError):
+            # Division by zero, overflow and domain errors leave the value unknown
+            return None
+        # A fractional power of a negative value is complex
+        return None if isinstance(result, complex) else result
+
+    return _numeric
+
+def compile_transforms(
+    device_type: str, data: Mapping[str, Any], transforms: Mapping[str, Any]
+) -> dict[str, Transform]:
+    """Compile the configured transforms, keyed by source entity id."""
+    compiled: dict[str, Transform] = {}
+    for key, spec in transforms.items():
+        if not (source := data.get(key)):
+            continue
+        transform = compile_transform(spec, get_characteristic(device_type, key))
+        for entity_id in source if isinstance(source, list) else [source]:
+            compiled[entity_id] = transform
+    return compiled